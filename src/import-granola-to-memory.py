@@ -4,18 +4,71 @@ Granola to Basic Memory Importer
 Syncs meetings from Granola into Basic Memory with smart incremental updates
 """
 
+import hashlib
 import json
+import math
 import os
+import re
+import time
+import zlib
+from array import array
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
+from itertools import chain
 import sys
 
-# Paths
-GRANOLA_CACHE = Path.home() / "Library/Application Support/Granola/cache-v3.json"
-MEMORY_BASE = Path.home() / "basic-memory/Granola"
+# Paths (overridable per account; see accounts_command)
+GRANOLA_CACHE = Path(os.environ.get('GRANOLA_CACHE') or
+                     Path.home() / "Library/Application Support/Granola/cache-v3.json").expanduser()
+MEMORY_BASE = Path(os.environ.get('GRANOLA_MEMORY_BASE') or Path.home() / "basic-memory/Granola").expanduser()
 STATE_FILE = MEMORY_BASE / ".granola-sync-state.json"
+FINGERPRINT_FILE = MEMORY_BASE / ".granola-fingerprint"
+JOURNAL_FILE = MEMORY_BASE / ".granola-sync-journal.jsonl"
+PATHS_VERSION = 2            # Filename registry format (2: casefolded stems)
+METRICS_FILE = MEMORY_BASE / ".granola-metrics.jsonl"  # One line per sync, appended
+METRICS_VERSION = 1
+CHECKPOINT_EVERY = 100       # Meetings written between journal checkpoints
+LOCK_FILE = MEMORY_BASE / ".granola-sync.lock"
+PENDING_FILE = MEMORY_BASE / ".granola-sync.pending"
+LOCK_STALE_SECONDS = 6 * 3600  # Age after which a lock file without flock is considered abandoned
 TRANSCRIPTS_DIR = MEMORY_BASE / "_transcripts"
+FOLDER_INDEX_NAME = "_index.md"
+SNAPSHOT_FILE = MEMORY_BASE / ".granola-snapshot.json"
+PREV_SNAPSHOT_FILE = MEMORY_BASE / ".granola-snapshot.prev.json"
+SNAPSHOT_VERSION = 2
+DOCS_INDEX_FILE = MEMORY_BASE / ".granola-docs.bin"
+DOCS_INDEX_MAGIC = b"GRDOCS1\n"
+DOCS_INDEX_FIELDS = ('id', 'title', 'created_at', 'updated_at', 'deleted_at',
+                     'people', 'summary', 'overview', 'notes_markdown')
+MINHASH_FILE = MEMORY_BASE / ".granola-minhash.bin"
+MINHASH_MAGIC = b"GRMH1\n"
+COLUMNS_DIR = MEMORY_BASE / ".granola-columns"
+COLUMNS_VERSION = 1
+RAG_DIR = MEMORY_BASE / "_rag"
+RAG_CHUNK_CHARS = 1200       # Target chunk size for the RAG export
+RAG_DIM = 256                # Dimensions of the built-in hashing embedder
+RAG_IVF_MIN_VECTORS = 20000  # Build an IVF index (NumPy only) above this size
+RAG_IVF_PROBES = 8
+DUPLICATES_NOTE = "_duplicates.md"
+PEOPLE_NOTE = "_people.md"
+SILENCE_MIN_GAP = 2.0        # Seconds between segments counted as silence
+TRANSCRIPT_INDEX_VERSION = 1
+DEDUP_BANDS = 16             # LSH bands x rows = MinHash bins per signature
+DEDUP_ROWS = 4
+DEDUP_THRESHOLD = 0.8        # Estimated Jaccard similarity to report a pair
+DEDUP_MIN_TOKENS = 20        # Meetings with less text are not compared
+TEMPLATE_VERSION = 2         # Bump whenever rendered notes, stubs or transcripts change
+RENDER_FIELDS = ('title', 'created_at', 'summary', 'notes_markdown', 'notes_plain', 'notes',
+                 'people', 'metadata')
+FSYNC_MODES = ('none', 'run', 'files')  # Durability strategy for --fsync=
+WRITER_QUEUE_SIZE = 256      # Pending writes before --io-thread applies backpressure
+WRITER_BATCH_OPS = 64        # Queued operations performed as one batch without --io-thread
+WRITER_BATCH_BYTES = 8 * 1024 * 1024  # ...or sooner, once this much data is queued
+WRITE_BUFFER_SIZE = 64 * 1024  # Chunks of a rendered file gathered per write()
+RENDER_SPOOL_SIZE = 1024 * 1024  # Rendered notes larger than this are spooled to a temp file
+SINKS = ('files', 'sqlite', 'jsonl')  # Output backends for --sink=
+SQLITE_DB = MEMORY_BASE.parent / "granola.db"
 
 # Colors for terminal output
 class Colors:
@@ -33,6 +86,16 @@ def log(msg, color=None):
     else:
         print(msg)
 
+# Progress reporting and time formatting are shared with the utility scripts:
+# src/utils/granola_progress.py, or a copy installed next to this script
+sys.path.append(str(Path(__file__).resolve().parent / "utils"))
+try:
+    from granola_progress import Progress, format_duration, format_timestamp
+except ImportError:
+    log("❌ granola_progress.py not found: copy src/utils/granola_progress.py next to this script",
+        Colors.RED)
+    sys.exit(1)
+
 def load_granola_data():
     """Load and parse Granola cache"""
     log("📂 Loading Granola cache...", Colors.BLUE)
@@ -49,20 +112,215 @@ def load_granola_data():
 
     return state
 
-def load_sync_state():
+def cache_fingerprint():
+    """Size and mtime of the Granola cache as a short string, or None if missing"""
+    try:
+        stat = os.stat(GRANOLA_CACHE)
+    except OSError:
+        return None
+    return f"{stat.st_size} {stat.st_mtime_ns}"
+
+def write_fingerprint(fingerprint):
+    """Record the cache fingerprint a completed sync was built from"""
+    with open(FINGERPRINT_FILE, 'w') as f:
+        f.write(fingerprint + "\n")
+
+def synced_fingerprint():
+    """Cache fingerprint the last completed full sync was built from, or None"""
+    try:
+        with open(FINGERPRINT_FILE, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def check_command():
+    """Entry point for --check: exit 0 if up to date, 1 if a sync is needed
+
+    Only stats the cache and reads the fingerprint file, so it is cheap
+    enough for launchd to run every minute (e.g. `--check || sync`).
+    """
+    current = cache_fingerprint()
+    if current is None:
+        log(f"❌ Granola cache not found at: {GRANOLA_CACHE}", Colors.RED)
+        sys.exit(2)
+
+    if synced_fingerprint() == current and STATE_FILE.exists():
+        log("✅ Up to date", Colors.GREEN)
+        sys.exit(0)
+    log("🔄 Sync needed", Colors.YELLOW)
+    sys.exit(1)
+
+def load_sync_state(path=STATE_FILE):
     """Load previous sync state"""
-    if STATE_FILE.exists():
-        with open(STATE_FILE, 'r') as f:
+    if path.exists():
+        with open(path, 'r') as f:
             return json.load(f)
     return {
         "last_sync": None,
         "meetings": {}
     }
 
-def save_sync_state(state):
-    """Save sync state"""
-    with open(STATE_FILE, 'w') as f:
+def save_sync_state(state, path=STATE_FILE):
+    """Save sync state atomically (a crash leaves the old or the new file)"""
+    tmp_file = path.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
         json.dump(state, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+class RunLock:
+    """Advisory lock held while a sync writes notes and sync state
+
+    Uses flock() where available: the kernel drops it when the holder
+    exits or crashes, so a leftover lock file is never mistaken for a
+    running sync. Without fcntl (Windows) it falls back to an
+    exclusive-create lock file, treated as stale once older than
+    LOCK_STALE_SECONDS.
+    """
+
+    def __init__(self, path=LOCK_FILE):
+        self.path = path
+        self.fd = None
+        self.flock = True
+
+    def acquire(self):
+        """Take the lock without waiting; False if another sync holds it"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            import fcntl
+        except ImportError:
+            return self._acquire_exclusive()
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()} {datetime.now().isoformat()}\n".encode('utf-8'))
+        self.fd = fd
+        return True
+
+    def _acquire_exclusive(self):
+        self.flock = False
+        for _ in range(2):
+            try:
+                fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                try:
+                    age = datetime.now().timestamp() - os.stat(self.path).st_mtime
+                except FileNotFoundError:
+                    continue
+                if age < LOCK_STALE_SECONDS:
+                    return False
+                log(f"🔓 Removing stale lock left by pid {self.holder()} ({age / 3600:.0f}h old)", Colors.YELLOW)
+                try:
+                    os.unlink(self.path)
+                except FileNotFoundError:
+                    pass
+                continue
+            os.write(fd, f"{os.getpid()} {datetime.now().isoformat()}\n".encode('utf-8'))
+            self.fd = fd
+            return True
+        return False
+
+    def holder(self):
+        """Pid recorded by the current lock holder, or None"""
+        try:
+            with open(self.path, 'r') as f:
+                return int(f.read().split()[0])
+        except (OSError, ValueError, IndexError):
+            return None
+
+    def release(self):
+        if self.fd is None:
+            return
+        if not self.flock:
+            os.unlink(self.path)
+        os.close(self.fd)  # Closing drops the flock
+        self.fd = None
+
+def take_pending():
+    """Consume a request left by a sync that found the lock taken"""
+    try:
+        PENDING_FILE.unlink()
+        return True
+    except FileNotFoundError:
+        return False
+
+class SyncJournal:
+    """Checkpoint log of meetings written since the sync state was last saved
+
+    Every CHECKPOINT_EVERY meetings the sync drains its writer, syncing
+    the files to disk whatever --fsync is, and then appends those
+    meetings' state records here, so an entry only exists once its files
+    are durable. After a crash the next run replays the
+    journal into the saved state and carries on from there; a completed
+    run saves the state and deletes the journal.
+
+    With dry_run=True (--plan) the journal is only replayed; record() and
+    clear() leave the file alone.
+    """
+
+    def __init__(self, path=JOURNAL_FILE, dry_run=False):
+        self.path = path
+        self.dry_run = dry_run
+        self.resumed = set()
+        self.resumed_folders = set()
+        self.file = None
+
+    def replay(self, sync_state):
+        """Apply records left by an interrupted run; returns how many"""
+        if not self.path.exists():
+            return 0
+
+        with open(self.path, 'r') as f:
+            lines = f.readlines()
+
+        meetings = sync_state['meetings']
+        registry = sync_state.get('paths')
+        for line in lines:
+            try:
+                doc_id, record = json.loads(line)
+            except ValueError:
+                break  # Torn final line from the crash
+
+            prev = meetings.get(doc_id, {})
+            if registry is not None:
+                prev_key = stem_key(meeting_stem(prev))
+                if prev_key and prev_key != stem_key(record['stem']) and registry.get(prev_key) == doc_id:
+                    del registry[prev_key]
+                registry[stem_key(record['stem'])] = doc_id
+            self.resumed_folders.update(prev.get('all_folders', []))
+            self.resumed_folders.update(record['all_folders'])
+            meetings[doc_id] = record
+            self.resumed.add(doc_id)
+        return len(self.resumed)
+
+    def record(self, sync_state, doc_ids):
+        """Append durable entries for meetings whose files are on disk"""
+        if self.dry_run:
+            return
+        if self.file is None:
+            self.file = open(self.path, 'a')
+        for doc_id in doc_ids:
+            self.file.write(json.dumps([doc_id, sync_state['meetings'][doc_id]], separators=(',', ':')) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def clear(self):
+        """Forget the journal once the full state has been saved"""
+        if self.dry_run:
+            return
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
 
 def format_date(date_str):
     """Convert ISO date to readable format"""
@@ -94,6 +352,92 @@ def safe_filename(name, date_str=None):
 
     return f"{prefix}{safe}"
 
+def load_path_registry(sync_state):
+    """Registry of casefolded filename stem -> owning doc id, kept in sync state
+
+    Every file a meeting writes (note, stubs, transcript) is named after
+    its stem, so owning the stem reserves all of them. Stems are compared
+    casefolded because macOS file systems are case-insensitive. State
+    from before the registry (or before it was casefolded) is migrated
+    once; doc ids that shared a stem there are returned so their files
+    get rewritten.
+    """
+    collided = set()
+    if sync_state.get('paths_version') != PATHS_VERSION:
+        registry = {}
+        for doc_id, meeting in sync_state['meetings'].items():
+            key = stem_key(meeting_stem(meeting))
+            if key:
+                owner = registry.setdefault(key, doc_id)
+                if owner != doc_id:
+                    collided.update((owner, doc_id))
+        sync_state['paths'] = registry
+        sync_state['paths_version'] = PATHS_VERSION
+    return sync_state['paths'], collided
+
+def stem_key(stem):
+    """Registry key for a filename stem (case-insensitive, like APFS and HFS+)"""
+    return stem.casefold()
+
+def meeting_stem(meeting):
+    """Filename stem recorded for a synced meeting ('' if none)"""
+    return meeting.get('stem') or meeting.get('file', '')[:-len('.md')]
+
+def meeting_paths(meeting):
+    """Files (relative to MEMORY_BASE) written for a synced meeting"""
+    if 'paths' in meeting:
+        return meeting['paths']
+    if 'file' not in meeting:
+        return []
+    # Entries from before paths were recorded: derive them
+    stem = meeting_stem(meeting)
+    paths = [f"{folder}/{meeting['file']}" for folder in meeting.get('all_folders', [])]
+    paths += [f"{TRANSCRIPTS_DIR.name}/{stem}_transcript.txt", f"{TRANSCRIPTS_DIR.name}/{stem}_transcript.idx.json"]
+    return paths
+
+def meeting_names(doc_id, title, created_at, prev_state, registry):
+    """Display date and filename stem for a meeting
+
+    Both depend only on the title and creation time, so they are reused
+    from the sync state unless either changed. A stem another meeting
+    already owns (same title on the same day) gets the doc id appended,
+    so names never collide and stay stable across runs. A stem the
+    meeting no longer uses is released.
+    """
+    prev_stem = meeting_stem(prev_state)
+    prev_key = stem_key(prev_stem)
+    if prev_state.get('title') == title and prev_state.get('created_at') == created_at:
+        if prev_stem and registry.get(prev_key) == doc_id:
+            return prev_state.get('date') or format_date(created_at), prev_stem
+
+    stem = safe_filename(title, created_at)
+    if registry.setdefault(stem_key(stem), doc_id) != doc_id:
+        stem = f"{stem}_{doc_id[:8]}"
+        registry[stem_key(stem)] = doc_id
+    if prev_key != stem_key(stem) and registry.get(prev_key) == doc_id:
+        del registry[prev_key]
+    return format_date(created_at), stem
+
+def remove_stale_paths(writer, doc_id, prev_state, paths, registry):
+    """Delete files a meeting wrote last sync but no longer writes
+
+    Returns the number of removed stubs. Files under a stem now owned by
+    another meeting are left alone; that meeting has overwritten them.
+    """
+    if registry.get(stem_key(meeting_stem(prev_state)), doc_id) != doc_id:
+        return 0
+
+    removed_stubs = 0
+    current = set(paths)
+    for rel_path in meeting_paths(prev_state):
+        if rel_path in current:
+            continue
+        writer.unlink(MEMORY_BASE / rel_path)
+        if not rel_path.startswith(f"{prev_state.get('primary_folder')}/") and \
+                not rel_path.startswith(f"{TRANSCRIPTS_DIR.name}/"):
+            removed_stubs += 1
+    return removed_stubs
+
 def build_folder_mappings(state):
     """Build mappings between documents, folders, and metadata"""
     log("🗂️  Building folder mappings...", Colors.BLUE)
@@ -121,11 +465,88 @@ def build_folder_mappings(state):
 
     return doc_to_folders, folder_names, folder_metadata
 
+def select_doc_ids(state, doc_to_folders, folder_names, selection):
+    """Doc ids matching --folder/--since/--until/--doc, or None to sync all
+
+    Each filter is answered from an index rather than by visiting every
+    document: folder membership from documentLists, dates by bisecting
+    the documents sorted by created_at, and ids directly. Filters combine
+    with AND; repeated --folder or --doc values combine with OR. Both
+    dates are inclusive: --until YYYY-MM-DD takes in that whole day.
+    """
+    from bisect import bisect_left, bisect_right
+    if not any(selection.values()):
+        return None
+
+    documents = state.get('documents', {})
+    document_lists = state.get('documentLists', {})
+    selected = None
+
+    def narrow(doc_ids):
+        return set(doc_ids) if selected is None else selected & set(doc_ids)
+
+    if selection['docs']:
+        selected = narrow(selection['docs'])
+
+    if selection['folders']:
+        folder_ids = {}
+        for folder_id, name in folder_names.items():
+            folder_ids.setdefault(name, []).append(folder_id)
+        in_folders = set()
+        for name in selection['folders']:
+            if name == 'Unfiled':
+                in_folders.update(d for d in documents if d not in doc_to_folders)
+            elif name in folder_ids:
+                for folder_id in folder_ids[name]:
+                    in_folders.update(document_lists.get(folder_id, []))
+            else:
+                log(f"❌ Unknown folder: {name} (folders: {', '.join(sorted(folder_ids))})", Colors.RED)
+                sys.exit(2)
+        selected = narrow(in_folders)
+
+    if selection['since'] or selection['until']:
+        # ISO timestamps sort chronologically as strings
+        timeline = sorted((str(doc.get('created_at') or ''), doc_id) for doc_id, doc in documents.items())
+        keys = [created for created, _ in timeline]
+        lo = bisect_left(keys, selection['since']) if selection['since'] else 0
+        hi = len(keys)
+        if selection['until']:
+            # Every timestamp on the --until day sorts before the day + U+FFFF
+            until = selection['until'] + ('\uffff' if len(selection['until']) == 10 else '')
+            hi = bisect_right(keys, until)
+        selected = narrow(doc_id for _, doc_id in timeline[lo:hi])
+
+    return selected
+
 def get_meeting_folders(doc_id, doc_to_folders, folder_names):
     """Get list of folder names for a document"""
     folder_ids = doc_to_folders.get(doc_id, [])
     return [folder_names.get(fid, 'Unknown') for fid in folder_ids]
 
+def get_people(doc):
+    """Get attendee names for a document"""
+    people_list = []
+    people = doc.get('people', {})
+    if isinstance(people, dict):
+        attendees = people.get('attendees', [])
+        if isinstance(attendees, list):
+            for person in attendees:
+                if isinstance(person, dict):
+                    name = person.get('name') or person.get('email', '')
+                    if name:
+                        people_list.append(name)
+    return people_list
+
+def summary_first_line(summary, limit=120):
+    """Get the first non-empty line of a summary, for index listings"""
+    if not summary or not isinstance(summary, str):
+        return ""
+    for line in summary.splitlines():
+        line = line.strip()
+        if line:
+            return line if len(line) <= limit else line[:limit - 1] + "…"
+    return ""
+
 def parse_tiptap_to_markdown(notes_obj):
     """Parse TipTap/ProseMirror JSON format to markdown"""
     if not notes_obj or not isinstance(notes_obj, dict):
@@ -235,12 +656,8 @@ def parse_tiptap_to_markdown(notes_obj):
 
     return '\n\n'.join(markdown_parts)
 
-def format_meeting_content(doc, folders, primary_folder, transcript_filename=None, doc_panels=None):
-    """Format meeting note content"""
-    title = doc.get('title', 'Untitled Meeting')
-    created = doc.get('created_at', '')
-    summary = doc.get('summary', '')
-
+def get_private_notes(doc):
+    """Get private notes as (markdown, plain), parsing TipTap if needed"""
     # Try to get notes from multiple sources
     notes_md = doc.get('notes_markdown', '')
     notes_plain = doc.get('notes_plain', '')
@@ -251,8 +668,10 @@ def format_meeting_content(doc, folders, primary_folder, transcript_filename=Non
         if notes_obj:
             notes_md = parse_tiptap_to_markdown(notes_obj)
 
-    # Parse AI-enhanced panels
-    enhanced_notes = []
+    return notes_md, notes_plain
+
+def iter_enhanced_notes(doc_panels):
+    """(title, markdown) for each AI-enhanced panel, parsed one at a time"""
     if doc_panels:
         for panel_id, panel_data in doc_panels.items():
             if isinstance(panel_data, dict):
@@ -261,19 +680,48 @@ def format_meeting_content(doc, folders, primary_folder, transcript_filename=Non
                 if panel_content:
                     panel_md = parse_tiptap_to_markdown(panel_content)
                     if panel_md:
-                        enhanced_notes.append((panel_title, panel_md))
+                        yield panel_title, panel_md
+
+def get_enhanced_notes(doc_panels):
+    """Parse AI-enhanced panels into (title, markdown) pairs"""
+    return list(iter_enhanced_notes(doc_panels))
+
+def truncate_section(text, limit):
+    """Text cut to limit bytes of UTF-8, with a marker saying how much was left out"""
+    # A character is at most 4 bytes, so shorter text needs no encoding
+    if not limit or len(text) * 4 <= limit:
+        return text
+    data = text.encode('utf-8')
+    if len(data) <= limit:
+        return text
+    head = data[:limit].decode('utf-8', errors='ignore')
+    # Prefer cutting at a line break so markdown isn't split mid-line
+    cut = head.rfind("\n", len(head) // 2)
+    if cut > 0:
+        head = head[:cut]
+    return (head + f"\n\n> ✂️ *Truncated: showing {len(head.encode('utf-8')):,} of {len(data):,} bytes. "
+                   f"The full text is in Granola.*\n")
+
+def iter_meeting_content(doc, folders, primary_folder, transcript_filename=None, doc_panels=None,
+                         transcript_stats=None, date=None, section_limit=None):
+    """Meeting note content as a series of chunks
+
+    Panels are parsed and yielded one at a time, so only one section is
+    held in memory. With section_limit, the private notes and each panel
+    are cut to that many bytes.
+    """
+    title = doc.get('title', 'Untitled Meeting')
+    date = date or format_date(doc.get('created_at', ''))
+    summary = doc.get('summary', '')
+
+    notes_md, notes_plain = get_private_notes(doc)
+
+    # AI-enhanced panels; the first is parsed up front to know whether there are any
+    enhanced_notes = iter_enhanced_notes(doc_panels)
+    first_panel = next(enhanced_notes, None)
 
     # People
-    people_list = []
-    people = doc.get('people', {})
-    if isinstance(people, dict):
-        attendees = people.get('attendees', [])
-        if isinstance(attendees, list):
-            for person in attendees:
-                if isinstance(person, dict):
-                    name = person.get('name') or person.get('email', '')
-                    if name:
-                        people_list.append(name)
+    people_list = get_people(doc)
 
     # Granola link
     metadata = doc.get('metadata', {})
@@ -282,87 +730,876 @@ def format_meeting_content(doc, folders, primary_folder, transcript_filename=Non
     else:
         granola_url = ''
 
-    # Build content
-    content = f"# {title}\n\n"
-    content += f"**Date:** {format_date(created)}\n"
-    content += f"**Primary Folder:** {primary_folder}\n"
+    # Header
+    header = [f"# {title}\n\n", f"**Date:** {date}\n", f"**Primary Folder:** {primary_folder}\n"]
 
     if len(folders) > 1:
         other_folders = [f for f in folders if f != primary_folder]
-        content += f"**Also in:** {', '.join(other_folders)}\n"
+        header.append(f"**Also in:** {', '.join(other_folders)}\n")
 
     if people_list:
-        content += f"**People:** {', '.join(people_list)}\n"
+        header.append(f"**People:** {', '.join(people_list)}\n")
 
     if granola_url:
-        content += f"**Granola:** [View in app]({granola_url})\n"
+        header.append(f"**Granola:** [View in app]({granola_url})\n")
 
     # Summary
     if summary:
-        content += f"\n## Summary\n\n{summary}\n"
+        header.append(f"\n## Summary\n\n{summary}\n")
+    yield "".join(header)
 
     # Manual/Private Notes
     if notes_md or notes_plain:
-        content += f"\n## Private Notes\n\n"
-        content += notes_md or notes_plain
-    elif not enhanced_notes:
-        content += f"\n## Notes\n\n*No notes recorded*\n"
+        yield "\n## Private Notes\n\n"
+        yield truncate_section(notes_md or notes_plain, section_limit)
+    elif first_panel is None:
+        yield "\n## Notes\n\n*No notes recorded*\n"
 
     # AI-Enhanced Notes (from panels)
-    if enhanced_notes:
-        content += f"\n## AI-Enhanced Notes\n\n"
-        for panel_title, panel_content in enhanced_notes:
+    if first_panel is not None:
+        yield "\n## AI-Enhanced Notes\n\n"
+        for panel_title, panel_content in chain([first_panel], enhanced_notes):
             if panel_title:
-                content += f"### {panel_title}\n\n"
-            content += panel_content + "\n\n"
+                yield f"### {panel_title}\n\n"
+            yield truncate_section(panel_content, section_limit) + "\n\n"
 
     # Transcript link
     if transcript_filename:
-        content += f"\n## Transcript\n\n[[_transcripts/{transcript_filename}]]\n"
+        yield f"\n## Transcript\n\n[[_transcripts/{transcript_filename}]]\n"
 
-    return content
+    if transcript_stats:
+        yield format_transcript_stats(transcript_stats)
+
+def format_meeting_content(doc, folders, primary_folder, transcript_filename=None, doc_panels=None,
+                           transcript_stats=None, date=None, section_limit=None):
+    """Format meeting note content"""
+    return "".join(iter_meeting_content(doc, folders, primary_folder, transcript_filename, doc_panels,
+                                        transcript_stats, date, section_limit))
 
-def create_stub_file(title, primary_path, date_str, also_in_folders):
+def create_stub_file(title, primary_path, date, also_in_folders):
     """Create stub file that links to primary location"""
-    content = f"# {title}\n\n"
-    content += f"→ **This meeting is located in:** [[{primary_path}]]\n\n"
-    content += f"**Date:** {format_date(date_str)}\n"
+    parts = [f"# {title}\n\n", f"→ **This meeting is located in:** [[{primary_path}]]\n\n", f"**Date:** {date}\n"]
 
     if also_in_folders:
-        content += f"**Also filed in:** {', '.join(also_in_folders)}\n"
+        parts.append(f"**Also filed in:** {', '.join(also_in_folders)}\n")
+
+    parts.append("\n---\n\n")
+    parts.append(f"[View full meeting →]({primary_path})\n")
+
+    return "".join(parts)
+
+def render_input_hash(doc, doc_panels, transcript_data, folders, stem):
+    """Hash of everything a meeting's note, stubs and transcript are rendered from
+
+    Granola bumps updated_at for edits that don't change any of these
+    (e.g. sharing or viewing), so meetings are compared by this instead
+    of re-rendered whenever the timestamp moves.
+    """
+    panels = []
+    if isinstance(doc_panels, dict):
+        for panel in doc_panels.values():
+            if isinstance(panel, dict):
+                panels.append([panel.get('title'), panel.get('content')])
+    # The transcript is the largest input; it is hashed segment by segment
+    # instead of being serialized whole into the inputs
+    transcript = transcript_data
+    if isinstance(transcript_data, list):
+        transcript = [len(transcript_data), field_signature(*transcript_data)]
+    inputs = [TEMPLATE_VERSION, stem, folders,
+              [doc.get(field) for field in RENDER_FIELDS], panels, transcript]
+    data = json.dumps(inputs, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+def render_version(meeting):
+    """Template version a synced meeting was rendered with"""
+    # Meetings synced before versioning were rendered with version 1
+    return meeting.get('render', {}).get('version', 1)
+
+class TranscriptStats:
+    """Per-speaker transcript statistics, stored as parallel arrays
+
+    Speakers are indexed in order of first appearance; talk time, words and
+    turns are array columns indexed by speaker rather than a dict per
+    segment or per speaker.
+    """
+
+    def __init__(self):
+        self.speakers = []
+        self.speaker_index = {}
+        self.talk_time = array('d')
+        self.words = array('l')
+        self.turns = array('l')
+        self.silence = 0.0
+        self.gaps = 0
+        self.longest_gap = 0.0
+        self.duration = 0.0
+        self.timed = False
+        self.line_start = array('d')
+        self.line_end = array('d')
+        self.line_speaker = array('l')
+
+    def speaker_slot(self, speaker):
+        """Index of a speaker, adding a column entry on first sight"""
+        idx = self.speaker_index.get(speaker)
+        if idx is None:
+            idx = self.speaker_index[speaker] = len(self.speakers)
+            self.speakers.append(speaker)
+            self.talk_time.append(0.0)
+            self.words.append(0)
+            self.turns.append(0)
+        return idx
+
+    def to_state(self):
+        """Compact form stored in sync state"""
+        return {
+            'speakers': self.speakers,
+            'talk': [round(t, 1) for t in self.talk_time],
+            'words': list(self.words),
+            'turns': list(self.turns),
+            'silence': round(self.silence, 1),
+            'gaps': self.gaps,
+            'longest_gap': round(self.longest_gap, 1),
+            'duration': round(self.duration, 1),
+        }
 
-    content += f"\n---\n\n"
-    content += f"[View full meeting →]({primary_path})\n"
+def segment_times(segment):
+    """(start, end) of a transcript segment in seconds, or (None, None)
 
-    return content
+    Uses numeric start_time/end_time when present, otherwise ISO
+    start_timestamp/end_timestamp as epoch seconds.
+    """
+    start, end = segment.get('start_time'), segment.get('end_time')
+    if isinstance(start, (int, float)) and isinstance(end, (int, float)):
+        return float(start), float(end)
+
+    start, end = segment.get('start_timestamp'), segment.get('end_timestamp')
+    if start and end:
+        try:
+            return (datetime.fromisoformat(start.replace('Z', '+00:00')).timestamp(),
+                    datetime.fromisoformat(end.replace('Z', '+00:00')).timestamp())
+        except (AttributeError, ValueError):
+            pass
+    return None, None
+
+def parse_transcript(transcript_data):
+    """Walk the segments once, returning (lines, stats)
+
+    lines are the exported "[Speaker] text" strings; stats holds the
+    per-speaker totals plus, per line, its start/end (relative to the first
+    timed segment, NaN when unknown) and speaker index.
+    """
+    if not transcript_data or not isinstance(transcript_data, list):
+        return [], None
+
+    lines = []
+    stats = TranscriptStats()
+    first_start = None
+    prev_end = None
+    prev_speaker = None
+
+    for segment in transcript_data:
+        if not isinstance(segment, dict):
+            continue
+
+        text = segment.get('text', '')
+        speaker = segment.get('speaker', None)
+
+        idx = stats.speaker_slot(speaker or segment.get('source') or 'Unknown')
+        stats.words[idx] += len(text.split()) if text else 0
+        if idx != prev_speaker:
+            stats.turns[idx] += 1
+            prev_speaker = idx
+
+        start, end = segment_times(segment)
+        if start is not None:
+            stats.timed = True
+            if first_start is None:
+                first_start = start
+            stats.talk_time[idx] += max(0.0, end - start)
+            if prev_end is not None:
+                gap = start - prev_end
+                if gap >= SILENCE_MIN_GAP:
+                    stats.silence += gap
+                    stats.gaps += 1
+                    stats.longest_gap = max(stats.longest_gap, gap)
+            prev_end = end if prev_end is None else max(prev_end, end)
+
+        if text:
+            if speaker:
+                lines.append(f"[{speaker}] {text}")
+            else:
+                lines.append(text)
+            stats.line_start.append(start - first_start if start is not None else math.nan)
+            stats.line_end.append(end - first_start if start is not None else math.nan)
+            stats.line_speaker.append(idx)
+
+    if stats.timed:
+        stats.duration = prev_end - first_start
+
+    return lines, stats
+
+def process_transcript(transcript_data):
+    """Build transcript text and TranscriptStats in one pass over the segments
+
+    Returns (text, stats); text is None when there is nothing to export and
+    stats is None when segments carry no timing information.
+    """
+    lines, stats = parse_transcript(transcript_data)
+    text = "\n\n".join(lines) if lines else None
+    return text, (stats if text and stats.timed else None)
+
+def transcript_length(lines):
+    """Length of the transcript text the lines join into, without joining them"""
+    return sum(map(len, lines)) + 2 * (len(lines) - 1) if lines else 0
+
+def write_transcript_file(write, transcript_file, title, date, lines, stats):
+    """Write a transcript with timestamps plus its seekable sidecar index
+
+    write(path, data) queues each file, e.g. OutputWriter.write.
+
+    The sidecar (<name>.idx.json) records each segment's byte offset and
+    length, start/end seconds and speaker, and where each speaker turn
+    begins, so readers can seek straight to a time or turn.
+    The body is queued as a generator of lines rather than one string.
+    """
+    header = (f"Transcript: {title}\n"
+              f"Date: {date}\n"
+              f"\n{'-'*80}\n\n")
+
+    def timed_line(i):
+        start = stats.line_start[i] if stats else math.nan
+        if math.isnan(start):
+            return lines[i] if i == 0 else "\n\n" + lines[i]
+        line = f"[{format_timestamp(start)}] {lines[i]}"
+        return line if i == 0 else "\n\n" + line
+
+    def body():
+        yield header
+        for i in range(len(lines)):
+            yield timed_line(i)
+
+    segments = []
+    turns = []
+    offset = len(header.encode('utf-8'))
+    prev_speaker = None
+    for i in range(len(lines)):
+        start = stats.line_start[i] if stats else math.nan
+        end = stats.line_end[i] if stats else math.nan
+        speaker = stats.line_speaker[i] if stats else 0
+        size = len(timed_line(i).encode('utf-8'))
+        separator = 0 if i == 0 else 2
+        segments.append([offset + separator, size - separator,
+                         None if math.isnan(start) else round(start, 2),
+                         None if math.isnan(end) else round(end, 2), speaker])
+        if speaker != prev_speaker:
+            turns.append(i)
+            prev_speaker = speaker
+        offset += size
+
+    write(transcript_file, body())
+
+    index = {
+        'version': TRANSCRIPT_INDEX_VERSION,
+        'speakers': stats.speakers if stats else [],
+        'segments': segments,
+        'turns': turns,
+    }
+    write(transcript_index_path(transcript_file), json.dumps(index, separators=(',', ':')))
+
+def transcript_index_path(transcript_file):
+    """Sidecar index path for a transcript file"""
+    return transcript_file.with_name(transcript_file.stem + ".idx.json")
 
 def extract_transcript(transcript_data, doc_id):
     """Extract transcript text from transcript data"""
-    if not transcript_data:
-        return None
+    return process_transcript(transcript_data)[0]
+
+def format_transcript_stats(stats):
+    """Format the Transcript Stats section from a stats state dict"""
+    total_talk = sum(stats['talk']) or 1.0
+    content = "\n## Transcript Stats\n\n"
+    content += f"**Duration:** {format_duration(stats['duration'])} · "
+    content += f"**Silence:** {format_duration(stats['silence'])} in {stats['gaps']} gaps"
+    if stats['gaps']:
+        content += f" (longest {format_duration(stats['longest_gap'])})"
+    content += "\n\n| Speaker | Talk time | Share | Words | Turns |\n|---|---|---|---|---|\n"
+
+    order = sorted(range(len(stats['speakers'])), key=lambda i: -stats['talk'][i])
+    for i in order:
+        content += (f"| {stats['speakers'][i]} | {format_duration(stats['talk'][i])} | "
+                    f"{stats['talk'][i] / total_talk:.0%} | {stats['words'][i]} | {stats['turns'][i]} |\n")
+    return content
 
-    if isinstance(transcript_data, list):
-        if len(transcript_data) == 0:
-            return None
+def write_people_dashboard(writer, sync_state):
+    """Queue _people.md aggregating transcript stats across all meetings
 
-        segments = []
-        for segment in transcript_data:
-            if isinstance(segment, dict):
-                text = segment.get('text', '')
-                speaker = segment.get('speaker', None)
+    Built from the per-meeting stats in sync state; no transcript is read.
+    """
+    meetings = defaultdict(int)
+    talk = defaultdict(float)
+    words = defaultdict(int)
+    turns = defaultdict(int)
+    shares = defaultdict(float)
 
-                if text:
-                    if speaker:
-                        segments.append(f"[{speaker}] {text}")
-                    else:
-                        segments.append(text)
+    for meeting in sync_state['meetings'].values():
+        stats = meeting.get('transcript_stats')
+        if not stats:
+            continue
+        total_talk = sum(stats['talk']) or 1.0
+        for i, speaker in enumerate(stats['speakers']):
+            meetings[speaker] += 1
+            talk[speaker] += stats['talk'][i]
+            words[speaker] += stats['words'][i]
+            turns[speaker] += stats['turns'][i]
+            shares[speaker] += stats['talk'][i] / total_talk
+
+    content = "# People\n\n"
+    content += "Talk time across all synced meeting transcripts.\n\n"
+    content += "| Person | Meetings | Talk time | Words | Turns | Avg share |\n|---|---|---|---|---|---|\n"
+    for speaker in sorted(talk, key=lambda p: -talk[p]):
+        content += (f"| {speaker} | {meetings[speaker]} | {format_duration(talk[speaker])} | "
+                    f"{words[speaker]} | {turns[speaker]} | {shares[speaker] / meetings[speaker]:.0%} |\n")
+
+    writer.write(MEMORY_BASE / PEOPLE_NOTE, content)
+
+def format_folder_index(folder, entries):
+    """Format the _index.md note listing a folder's meetings"""
+    parts = [f"# {folder}\n\n", f"**Meetings:** {len(entries)}\n\n"]
+
+    for meeting in entries:
+        stem = meeting['file'][:-3] if meeting['file'].endswith('.md') else meeting['file']
+        date = meeting.get('date') or format_date(meeting.get('created_at'))
+        line = f"- **{date}** [[{stem}|{meeting['title']}]]"
+        if meeting['primary_folder'] != folder:
+            line += f" *(filed in {meeting['primary_folder']})*"
+        if meeting.get('people'):
+            line += f" — {', '.join(meeting['people'])}"
+        if meeting.get('summary_line'):
+            line += f"\n  {meeting['summary_line']}"
+        parts.append(line + "\n")
+
+    return "".join(parts)
+
+def write_folder_indexes(writer, sync_state, dirty_folders):
+    """Rewrite _index.md for folders whose meetings changed this run
+
+    Entries come from sync state, so no meeting files are read. Folders
+    missing their index (e.g. after upgrading) are regenerated as well.
+    """
+    folder_entries = defaultdict(list)
+    for meeting in sync_state['meetings'].values():
+        if 'file' not in meeting:
+            continue
+        for folder in meeting.get('all_folders', []):
+            folder_entries[folder].append(meeting)
+
+    for folder in folder_entries:
+        if not (MEMORY_BASE / folder / FOLDER_INDEX_NAME).exists():
+            dirty_folders.add(folder)
+
+    written = 0
+    for folder in dirty_folders:
+        index_file = MEMORY_BASE / folder / FOLDER_INDEX_NAME
+        entries = folder_entries.get(folder)
+        if not entries:
+            writer.unlink(index_file)
+            continue
 
-        return "\n\n".join(segments) if segments else None
+        entries.sort(key=lambda m: m.get('created_at') or '', reverse=True)
+        writer.write(index_file, format_folder_index(folder, entries))
+        written += 1
+
+    return written
+
+def write_blocks(data):
+    """bytes of a queued write: the data itself, the contents of a binary
+    file (closed afterwards), or its chunks encoded and gathered into
+    blocks of about WRITE_BUFFER_SIZE"""
+    if isinstance(data, bytes):
+        yield data
+        return
+    if hasattr(data, 'read'):
+        with data:
+            yield from iter(lambda: data.read(WRITE_BUFFER_SIZE), b'')
+        return
+    pending = []
+    size = 0
+    for chunk in data:
+        block = chunk.encode('utf-8')
+        pending.append(block)
+        size += len(block)
+        if size >= WRITE_BUFFER_SIZE:
+            yield b''.join(pending)
+            pending = []
+            size = 0
+    if pending:
+        yield b''.join(pending)
+
+class OutputWriter:
+    """Batched writer for the notes, stubs and transcripts a sync produces
+
+    Writes and deletes are queued while meetings are rendered and performed
+    in batches of WRITER_BATCH_OPS (or WRITER_BATCH_BYTES), so the queue
+    never holds more than one batch; each target directory is created
+    once. With threaded=True a background thread performs them as they
+    are queued instead, overlapping I/O with rendering.
+
+    Durability is one strategy per run: 'none' leaves flushing to the OS,
+    'run' issues a single sync() after the last write (and at each
+    checkpoint), and 'files' fsyncs each file as it is written and each
+    changed directory at the end or checkpoint.
+    Syscalls are counted for the sync report.
+
+    With dry_run=True nothing touches disk: each batch is only totalled
+    for the --plan report.
+    """
+
+    def __init__(self, fsync='none', threaded=False, dry_run=False):
+        self.fsync = fsync
+        self.dry_run = dry_run
+        self.ops = []
+        self.ops_bytes = 0
+        self.dirs = set()
+        self.changed_dirs = set()
+        self.counts = {'mkdir': 0, 'open': 0, 'write': 0, 'fsync': 0, 'unlink': 0, 'bytes': 0}
+        self.error = None
+        self.queue = None
+        if threaded:
+            import queue
+            import threading
+            self.queue = queue.Queue(maxsize=WRITER_QUEUE_SIZE)
+            self.thread = threading.Thread(target=self._drain, name='granola-writer', daemon=True)
+            self.thread.start()
+
+    def write(self, path, data):
+        """Queue writing data to path, replacing it
+
+        data is str, bytes, a binary file positioned at its start, or an
+        iterable of str chunks; chunks are only produced (rendered) when
+        the write is performed, and are written through a
+        WRITE_BUFFER_SIZE buffer.
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        self._submit(('write', path, data))
+
+    def unlink(self, path):
+        """Queue deleting path (missing files are ignored)"""
+        self._submit(('unlink', path, None))
+
+    def _submit(self, op):
+        if self.queue is None:
+            self.ops.append(op)
+            if isinstance(op[2], bytes):
+                self.ops_bytes += len(op[2])
+            if len(self.ops) >= WRITER_BATCH_OPS or self.ops_bytes >= WRITER_BATCH_BYTES:
+                self._perform()
+            return
+        if self.error:
+            raise self.error
+        self.queue.put(op)
+
+    def _drain(self):
+        # Any failure (a write error, or a bug while rendering chunks) is kept
+        # for the main thread to raise at its next submit, drain or flush; the
+        # remaining ops are only marked done, so queue.join() never waits forever
+        while True:
+            op = self.queue.get()
+            if op is None:
+                self.queue.task_done()
+                return
+            try:
+                if self.error is None:
+                    self._run(op)
+                elif hasattr(op[2], 'close'):
+                    op[2].close()
+            except BaseException as e:
+                self.error = e
+            finally:
+                self.queue.task_done()
+
+    def _mkdir(self, directory):
+        if directory not in self.dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self.counts['mkdir'] += 1
+            self.dirs.add(directory)
+
+    def _run(self, op):
+        kind, path, data = op
+        if kind == 'unlink':
+            try:
+                os.unlink(path)
+                self.counts['unlink'] += 1
+                self.changed_dirs.add(path.parent)
+            except FileNotFoundError:
+                pass
+            return
+
+        self._mkdir(path.parent)
+        self.changed_dirs.add(path.parent)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        self.counts['open'] += 1
+        try:
+            for block in write_blocks(data):
+                view = memoryview(block)
+                while view:
+                    written = os.write(fd, view)
+                    self.counts['write'] += 1
+                    view = view[written:]
+                self.counts['bytes'] += len(block)
+            if self.fsync == 'files':
+                os.fsync(fd)
+                self.counts['fsync'] += 1
+        finally:
+            os.close(fd)
+
+    def _perform(self):
+        """Perform (or, for a dry run, total) the batch queued in .ops"""
+        ops, self.ops, self.ops_bytes = self.ops, [], 0
+        if self.dry_run:
+            for kind, path, data in ops:
+                if kind == 'unlink':
+                    self.counts['unlink'] += path.exists()
+                    continue
+                if path.parent not in self.dirs:
+                    self.dirs.add(path.parent)
+                    self.counts['mkdir'] += not path.parent.exists()
+                self.counts['open'] += 1
+                self.counts['bytes'] += sum(len(block) for block in write_blocks(data))
+            return
+
+        # Each directory is created once, before any file in it is written
+        for directory in sorted({path.parent for kind, path, _ in ops if kind == 'write'}):
+            self._mkdir(directory)
+        for op in ops:
+            self._run(op)
+
+    def drain(self, durable=False):
+        """Perform the operations queued so far and apply the fsync strategy
+
+        With durable=True (checkpoints) the changes are synced to disk
+        even when fsync is 'none', using the 'run' barrier, so a journal
+        entry written afterwards never refers to files lost in a crash.
+        """
+        if self.queue is not None:
+            self.queue.join()
+            if self.error:
+                raise self.error
+        else:
+            self._perform()
+        if self.dry_run:
+            return
+
+        if self.fsync == 'files':
+            for directory in self.changed_dirs:
+                fd = os.open(directory, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                    self.counts['fsync'] += 1
+                finally:
+                    os.close(fd)
+        elif (self.fsync == 'run' or durable) and self.changed_dirs:
+            os.sync()
+            self.counts['fsync'] += 1
+        self.changed_dirs = set()
+
+    def flush(self):
+        """Perform all queued operations and stop the I/O thread; returns the counts"""
+        try:
+            self.drain()
+        finally:
+            if self.queue is not None:
+                self.queue.put(None)
+                self.thread.join()
+        return self.counts
+
+class FileSink:
+    """Markdown notes, stubs and transcripts under MEMORY_BASE (the default sink)"""
+
+    writes_tree = True
+    name = 'files'
+
+    def __init__(self, writer=None, section_limit=None):
+        self.writer = writer or OutputWriter()
+        self.section_limit = section_limit
+        self.rendered_bytes = 0
+        self.state_file = STATE_FILE
+        self.journal_file = JOURNAL_FILE
+
+    def write_meeting(self, meeting, stats, registry, force):
+        """Queue a meeting's files; returns (paths, content signature of each path)"""
+        writer = self.writer
+        doc_id = meeting['doc_id']
+        title = meeting['title']
+        date = meeting['date']
+        filename = meeting['filename']
+        folders = meeting['folders']
+        primary_folder = meeting['primary_folder']
+        prev_state = meeting['prev_state']
+        paths = [f"{primary_folder}/{filename}"]
+
+        # Every file is rendered once, hashed as it is spooled (so a large note
+        # is never held in memory as a whole), and only written when it differs
+        # from the render already there
+        prev_render = prev_state.get('render', {})
+        prev_paths = meeting_paths(prev_state)
+        # Meetings synced before per-file signatures only recorded the primary note's
+        prev_outputs = prev_render.get('outputs') or dict(zip(prev_paths[:1], [prev_render.get('output')]))
+        outputs = {}
+
+        def write(path, data):
+            """Queue path if its render changed; returns whether it was queued"""
+            rel_path = path.relative_to(MEMORY_BASE).as_posix()
+            outputs[rel_path], size, spool = spool_content([data] if isinstance(data, str) else data)
+            self.rendered_bytes += size
+            if force or outputs[rel_path] != prev_outputs.get(rel_path) or rel_path not in prev_paths:
+                writer.write(path, spool)
+                return True
+            spool.close()
+            return False
+
+        transcript_filename = None
+        if meeting['transcript_lines']:
+            transcript_filename = filename[:-len(".md")] + "_transcript.txt"
+            transcript_file = TRANSCRIPTS_DIR / transcript_filename
+            paths.append(f"{TRANSCRIPTS_DIR.name}/{transcript_filename}")
+            paths.append(f"{TRANSCRIPTS_DIR.name}/{transcript_index_path(transcript_file).name}")
+            write_transcript_file(write, transcript_file, title, date, meeting['transcript_lines'],
+                                  meeting['transcript_stats'])
+
+        # Write primary file
+        transcript_stats = meeting['transcript_stats'].to_state() if meeting['transcript_stats'] else None
+        write(MEMORY_BASE / primary_folder / filename, iter_meeting_content(
+            meeting['doc'], folders, primary_folder, transcript_filename,
+            meeting['doc_panels'], transcript_stats, date, self.section_limit))
 
-    return None
+        # Create/update stub files in additional folders
+        additional_folders = folders[1:]
+        for add_folder in additional_folders:
+            paths.append(f"{add_folder}/{filename}")
+            rel_path = f"../{primary_folder}/{filename}"
+            if write(MEMORY_BASE / add_folder / filename,
+                     create_stub_file(title, rel_path, date, additional_folders)):
+                stats['stubs_created'] += 1
+
+        # Remove notes, stubs and transcripts left behind by a rename or folder move
+        stats['stubs_deleted'] += remove_stale_paths(writer, doc_id, prev_state, paths, registry)
+        return paths, outputs
+
+    def delete_meetings(self, meetings, registry):
+        """Remove the note, stubs and transcript of meetings deleted in Granola"""
+        for doc_id, meeting in meetings.items():
+            # Files under a stem another meeting now owns are that meeting's
+            if registry.get(stem_key(meeting_stem(meeting)), doc_id) != doc_id:
+                continue
+            for rel_path in meeting_paths(meeting):
+                self.writer.unlink(MEMORY_BASE / rel_path)
+
+    def drain(self):
+        """Checkpoint: every file queued so far is on disk"""
+        self.writer.drain(durable=True)
+
+    def finish(self, sync_state, dirty_folders, stats):
+        stats['folder_indexes'] = write_folder_indexes(self.writer, sync_state, dirty_folders)
+        stats['io'] = self.writer.flush()
+
+def meeting_record(meeting):
+    """Structured form of a meeting for the database and stream sinks
+
+    'transcript' is the list of transcript lines; each sink joins or
+    streams them itself.
+    """
+    doc = meeting['doc']
+    metadata = doc.get('metadata', {})
+    transcript_stats = meeting['transcript_stats']
+    return {
+        'doc_id': meeting['doc_id'],
+        'title': meeting['title'],
+        'date': meeting['date'],
+        'created_at': doc.get('created_at', ''),
+        'updated_at': doc.get('updated_at', doc.get('created_at', '')),
+        'folders': meeting['folders'],
+        'people': get_people(doc),
+        'granola_url': metadata.get('url', '') if isinstance(metadata, dict) else '',
+        'summary': doc.get('summary', '') or '',
+        'notes': meeting['notes'] or '',
+        'panels': [{'title': panel_title, 'content': content}
+                   for panel_title, content in get_enhanced_notes(meeting['doc_panels'])],
+        'transcript': meeting['transcript_lines'],
+        'transcript_stats': transcript_stats.to_state() if transcript_stats else None,
+    }
 
-def sync_meetings(state, sync_state, force=False):
-    """Sync meetings from Granola to Basic Memory"""
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    id INTEGER PRIMARY KEY,
+    doc_id TEXT UNIQUE NOT NULL,
+    title TEXT, date TEXT, created_at TEXT, updated_at TEXT,
+    primary_folder TEXT, folders TEXT, people TEXT, granola_url TEXT,
+    summary TEXT, notes TEXT, transcript_stats TEXT, synced_at TEXT
+);
+CREATE TABLE IF NOT EXISTS panels (
+    doc_id TEXT NOT NULL, position INTEGER NOT NULL, title TEXT, content TEXT,
+    PRIMARY KEY (doc_id, position)
+);
+CREATE TABLE IF NOT EXISTS transcripts (
+    doc_id TEXT PRIMARY KEY, content TEXT
+);
+"""
+SQLITE_FTS = "CREATE VIRTUAL TABLE IF NOT EXISTS meetings_fts USING fts5(title, summary, notes, panels, transcript)"
+
+class SqliteSink:
+    """One row per meeting, panel and transcript in a SQLite database
+
+    Meetings are also indexed in the meetings_fts full-text table (when
+    the sqlite3 build has FTS5), whose rowid is meetings.id. Rows are
+    committed at each checkpoint and at the end, one transaction per batch.
+    """
+
+    writes_tree = False
+    name = 'sqlite'
+    section_limit = None
+
+    def __init__(self, path):
+        import sqlite3
+        self.path = Path(path).expanduser()
+        self.state_file = self.path.with_name(self.path.name + ".state.json")
+        self.journal_file = self.path.with_name(self.path.name + ".journal.jsonl")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path))
+        self.db.executescript(SQLITE_SCHEMA)
+        try:
+            self.db.execute(SQLITE_FTS)
+            self.fts = True
+        except sqlite3.OperationalError:
+            log("⚠️  This sqlite3 has no FTS5; writing tables without the full-text index", Colors.YELLOW)
+            self.fts = False
+        self.rows = 0
+
+    def write_meeting(self, meeting, stats, registry, force):
+        record = meeting_record(meeting)
+        record['transcript'] = "\n\n".join(record['transcript'])
+        doc_id = record['doc_id']
+        db = self.db
+        row = db.execute("SELECT id FROM meetings WHERE doc_id = ?", (doc_id,)).fetchone()
+
+        values = (record['title'], record['date'], record['created_at'], record['updated_at'],
+                  meeting['primary_folder'], json.dumps(record['folders']), json.dumps(record['people']),
+                  record['granola_url'], record['summary'], record['notes'],
+                  json.dumps(record['transcript_stats']) if record['transcript_stats'] else None,
+                  datetime.now().isoformat())
+        if row:
+            meeting_id = row[0]
+            db.execute("UPDATE meetings SET title = ?, date = ?, created_at = ?, updated_at = ?, primary_folder = ?, "
+                       "folders = ?, people = ?, granola_url = ?, summary = ?, notes = ?, transcript_stats = ?, "
+                       "synced_at = ? WHERE id = ?", values + (meeting_id,))
+        else:
+            meeting_id = db.execute(
+                "INSERT INTO meetings (doc_id, title, date, created_at, updated_at, primary_folder, folders, people, "
+                "granola_url, summary, notes, transcript_stats, synced_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (doc_id,) + values).lastrowid
+
+        db.execute("DELETE FROM panels WHERE doc_id = ?", (doc_id,))
+        db.executemany("INSERT INTO panels (doc_id, position, title, content) VALUES (?, ?, ?, ?)",
+                       [(doc_id, i, panel['title'], panel['content']) for i, panel in enumerate(record['panels'])])
+        if record['transcript']:
+            db.execute("INSERT OR REPLACE INTO transcripts (doc_id, content) VALUES (?, ?)",
+                       (doc_id, record['transcript']))
+        else:
+            db.execute("DELETE FROM transcripts WHERE doc_id = ?", (doc_id,))
+
+        if self.fts:
+            panels = "\n\n".join(f"{panel['title']}\n{panel['content']}" for panel in record['panels'])
+            db.execute("DELETE FROM meetings_fts WHERE rowid = ?", (meeting_id,))
+            db.execute("INSERT INTO meetings_fts (rowid, title, summary, notes, panels, transcript) "
+                       "VALUES (?, ?, ?, ?, ?, ?)", (meeting_id, record['title'], record['summary'],
+                                                     record['notes'], panels, record['transcript']))
+        self.rows += 1
+        return [], None
+
+    def delete_meetings(self, meetings, registry):
+        """Drop the rows of meetings deleted in Granola"""
+        db = self.db
+        for doc_id in meetings:
+            row = db.execute("SELECT id FROM meetings WHERE doc_id = ?", (doc_id,)).fetchone()
+            if row and self.fts:
+                db.execute("DELETE FROM meetings_fts WHERE rowid = ?", (row[0],))
+            db.execute("DELETE FROM meetings WHERE doc_id = ?", (doc_id,))
+            db.execute("DELETE FROM panels WHERE doc_id = ?", (doc_id,))
+            db.execute("DELETE FROM transcripts WHERE doc_id = ?", (doc_id,))
+
+    def drain(self):
+        self.db.commit()
+
+    def finish(self, sync_state, dirty_folders, stats):
+        self.db.commit()
+        self.db.close()
+        stats['folder_indexes'] = 0
+        stats['sink'] = f"{self.rows} meetings → {self.path}"
+
+class JsonlSink:
+    """One JSON line per new or changed meeting, for piping into other tools
+
+    Only meetings that changed since the last jsonl run are emitted, plus
+    a deletion line for each meeting deleted in Granola, so a consumer can
+    apply the stream as an incremental feed. Logs go to
+    stderr while this sink is in use.
+    """
+
+    writes_tree = False
+    name = 'jsonl'
+    section_limit = None
+
+    def __init__(self, out):
+        self.out = out
+        self.state_file = MEMORY_BASE / ".granola-sync-state.stream.json"
+        self.journal_file = MEMORY_BASE / ".granola-sync-journal.stream.jsonl"
+        self.rows = 0
+
+    def write_meeting(self, meeting, stats, registry, force):
+        # The transcript is escaped line by line into the output, so the
+        # line is never built as one string
+        record = meeting_record(meeting)
+        lines = record.pop('transcript')
+        transcript_stats = record.pop('transcript_stats')
+        out = self.out
+        out.write(json.dumps(record, ensure_ascii=False)[:-1] + ', "transcript": "')
+        for i, line in enumerate(lines):
+            out.write(("\\n\\n" if i else "") + json.dumps(line, ensure_ascii=False)[1:-1])
+        out.write(f'", "transcript_stats": {json.dumps(transcript_stats, ensure_ascii=False)}}}\n')
+        self.rows += 1
+        return [], None
+
+    def delete_meetings(self, meetings, registry):
+        """Emit a {"doc_id": ..., "deleted": true} line per meeting deleted in Granola"""
+        for doc_id in meetings:
+            self.out.write(json.dumps({'doc_id': doc_id, 'deleted': True}) + "\n")
+
+    def drain(self):
+        self.out.flush()
+
+    def finish(self, sync_state, dirty_folders, stats):
+        self.out.flush()
+        stats['folder_indexes'] = 0
+        stats['sink'] = f"{self.rows} meetings streamed"
+
+def end_phase(stats, name, started):
+    """Record a phase's duration in stats['phases']; returns the time it ended"""
+    now = time.monotonic()
+    stats['phases'][name] = round(now - started, 3)
+    return now
+
+def sync_meetings(state, sync_state, force=False, rag=None, sink=None, changes=None, selection=None,
+                  journal=None):
+    """Sync meetings from Granola to Basic Memory
+
+    Change detection is shared by every output sink (FileSink by default).
+    With a dry-run file sink nothing is written and derived notes are not
+    regenerated; each new, updated, moved or deleted meeting is appended
+    to changes (if given) for the --plan report. A selection (see
+    select_doc_ids) limits which meetings are checked and written. With
+    a journal, progress is checkpointed and meetings it resumed are not
+    redone, even under --force.
+    """
     documents = state.get('documents', {})
     transcripts = state.get('transcripts', {})
     document_panels = state.get('documentPanels', {})
@@ -380,17 +1617,68 @@ def sync_meetings(state, sync_state, force=False):
         'folders_removed': 0,
         'stubs_created': 0,
         'stubs_deleted': 0,
-        'transcripts_added': 0
+        'transcripts_added': 0,
+        'folder_indexes': 0,
+        'phases': {},
     }
+    phase_started = time.monotonic()
+
+    # Folders whose _index.md needs regenerating
+    dirty_folders = set(journal.resumed_folders) if journal else set()
+
+    # Meetings written since the last checkpoint
+    pending = []
+
+    # Meetings still present, for dropping stale RAG chunks
+    live_doc_ids = {doc_id for doc_id, doc in documents.items() if not doc.get('deleted_at')}
+
+    # Meetings to check this run
+    selected = select_doc_ids(state, doc_to_folders, folder_names, selection) if selection else None
+    if selected is not None:
+        log(f"🎯 Selected {len(selected)} of {len(documents)} meetings", Colors.BLUE)
 
-    # Create base directory
-    MEMORY_BASE.mkdir(parents=True, exist_ok=True)
-    TRANSCRIPTS_DIR.mkdir(parents=True, exist_ok=True)
+    # Token hashes of meetings needing a new MinHash signature, taken as each
+    # meeting is processed so its text isn't kept until the end of the sync
+    dedup_tokens = {}
+    token_cache = {}
+
+    # Whether any transcript stats changed, for the people dashboard
+    resumed = journal.resumed if journal else set()
+    people_changed = bool(resumed)
+
+    # Whether any per-meeting metadata changed, for the columnar snapshot
+    columns_changed = bool(resumed)
+
+    # Filename stems in use, so same-day meetings with the same title don't collide
+    registry, collided = load_path_registry(sync_state)
+
+    # Create base directory; everything else goes through the sink
+    if sink is None:
+        sink = FileSink()
+    dry_run = sink.writes_tree and sink.writer.dry_run
+    if not dry_run:
+        MEMORY_BASE.mkdir(parents=True, exist_ok=True)
+
+    # MinHash signatures live in their own binary file, not in the sync state
+    minhashes, dedup = load_minhashes() if sink.writes_tree else ({}, {})
+    minhashes_changed = False
+    for doc_id, meeting in sync_state['meetings'].items():
+        legacy = meeting.pop('minhash', None)
+        if legacy is not None:
+            minhashes.setdefault(doc_id, bytes.fromhex(legacy))
+            minhashes_changed = True
 
     # Process each document
-    for doc_id, doc in documents.items():
-        # Skip deleted
-        if doc.get('deleted_at'):
+    doc_ids = list(documents) if selected is None else sorted(selected)
+    # MB/s counts bytes as they are rendered; the writer's own count only
+    # moves when a batch is performed
+    rendered = (lambda: sink.rendered_bytes) if sink.writes_tree else None
+    progress = Progress('sync', len(doc_ids), bytes_done=rendered)
+    for doc_id in progress.track(doc_ids):
+        doc = documents.get(doc_id)
+
+        # Skip deleted (and --doc ids not in the cache)
+        if not doc or doc.get('deleted_at'):
             continue
 
         title = doc.get('title', 'Untitled')
@@ -403,13 +1691,19 @@ def sync_meetings(state, sync_state, force=False):
             folders = ['Unfiled']
 
         primary_folder = folders[0]
-        additional_folders = folders[1:] if len(folders) > 1 else []
 
         # Check if this is new or updated
         prev_state = sync_state['meetings'].get(doc_id, {})
         is_new = not prev_state
-
-        if not force and not is_new:
+        date, stem = meeting_names(doc_id, title, created_at, prev_state, registry)
+
+        # Entries written before folder indexes existed lack 'file' and are
+        # re-synced once to record it; so are meetings whose stem changed,
+        # whose file another meeting overwrote, or whose template or
+        # --max-section-kb differs from the one they were rendered with
+        if ((not force or doc_id in resumed) and not is_new and prev_state.get('file') == stem + ".md"
+                and doc_id not in collided and render_version(prev_state) == TEMPLATE_VERSION
+                and prev_state.get('render', {}).get('limit') == sink.section_limit):
             # Check if content changed
             if prev_state.get('last_updated_granola') == updated_at:
                 # Check if folders changed
@@ -418,78 +1712,1195 @@ def sync_meetings(state, sync_state, force=False):
 
                 if prev_folders == curr_folders:
                     stats['unchanged'] += 1
-                    continue
 
-        # Create filename
-        filename = safe_filename(title, created_at) + ".md"
-
-        # Create primary folder directory
-        primary_dir = MEMORY_BASE / primary_folder
-        primary_dir.mkdir(parents=True, exist_ok=True)
-        primary_file = primary_dir / filename
+                    # Backfill derived data for meetings synced before it existed
+                    needs_rag = rag is not None and rag.needs_export(doc_id)
+                    needs_stats = 'transcript_stats' not in prev_state
+                    needs_minhash = sink.writes_tree and doc_id not in minhashes
+                    needs_lengths = 'notes_len' not in prev_state
+                    if 'stem' not in prev_state:
+                        prev_state['stem'] = stem
+                        prev_state['date'] = date
+                    if needs_rag or needs_stats or needs_minhash or needs_lengths:
+                        transcript_lines, transcript_stats = parse_transcript(transcripts.get(doc_id))
+                        notes_md, notes_plain = get_private_notes(doc)
+                        if needs_stats:
+                            timed = transcript_length(transcript_lines) and transcript_stats.timed
+                            prev_state['transcript_stats'] = transcript_stats.to_state() if timed else None
+                            people_changed = True
+                        if needs_lengths:
+                            prev_state['notes_len'] = len(notes_md or notes_plain or '')
+                            prev_state['transcript_len'] = transcript_length(transcript_lines)
+                            columns_changed = True
+                        if needs_rag:
+                            rag.add_meeting(doc_id, build_rag_chunks(
+                                doc_id, doc, primary_folder, document_panels.get(doc_id, {}), transcript_lines
+                            ))
+                        if needs_minhash:
+                            dedup_tokens[doc_id] = dedup_token_hashes(doc, notes_md or notes_plain,
+                                                                      transcript_lines, token_cache)
+                    continue
 
-        # Check for transcript
-        transcript_filename = None
-        transcript_content = None
+        # Skip re-rendering when Granola moved the timestamp but nothing rendered changed
+        doc_panels = document_panels.get(doc_id, {})
         transcript_data = transcripts.get(doc_id)
+        render_input = render_input_hash(doc, doc_panels, transcript_data, folders, stem)
+        prev_render = prev_state.get('render', {})
+        if (not force and prev_render.get('input') == render_input and doc_id not in collided
+                and prev_state.get('file') == stem + ".md" and prev_render.get('limit') == sink.section_limit):
+            prev_state['last_updated_granola'] = updated_at
+            stats['unchanged'] += 1
+            continue
 
-        if transcript_data:
-            transcript_content = extract_transcript(transcript_data, doc_id)
-            if transcript_content:
-                transcript_filename = safe_filename(title, created_at) + "_transcript.txt"
-                transcript_file = TRANSCRIPTS_DIR / transcript_filename
-
-                # Write transcript
-                with open(transcript_file, 'w') as f:
-                    f.write(f"Transcript: {title}\n")
-                    f.write(f"Date: {format_date(created_at)}\n")
-                    f.write(f"\n{'-'*80}\n\n")
-                    f.write(transcript_content)
+        filename = stem + ".md"
 
-                stats['transcripts_added'] += 1
+        # Check for transcript; its lines are streamed to each output, never joined here
+        transcript_lines, parsed_stats = parse_transcript(transcript_data) if transcript_data else ([], None)
+        transcript_stats = None
+        if transcript_lines:
+            stats['transcripts_added'] += 1
+            if parsed_stats.timed:
+                transcript_stats = parsed_stats.to_state()
+                people_changed = True
 
-        # Get AI-enhanced panels for this document
-        doc_panels = document_panels.get(doc_id, {})
+        notes_md, notes_plain = get_private_notes(doc)
 
-        # Write primary file
-        content = format_meeting_content(doc, folders, primary_folder, transcript_filename, doc_panels)
-        with open(primary_file, 'w') as f:
-            f.write(content)
+        # Hand the meeting to the output sink
+        paths, outputs = sink.write_meeting({
+            'doc_id': doc_id,
+            'doc': doc,
+            'title': title,
+            'date': date,
+            'filename': filename,
+            'folders': folders,
+            'primary_folder': primary_folder,
+            'doc_panels': doc_panels,
+            'notes': notes_md or notes_plain,
+            'transcript_lines': transcript_lines,
+            'transcript_stats': parsed_stats if transcript_stats else None,
+            'prev_state': prev_state,
+        }, stats, registry, force)
 
         if is_new:
             stats['new'] += 1
         else:
             stats['updated'] += 1
 
-        # Create/update stub files in additional folders
-        for add_folder in additional_folders:
-            stub_dir = MEMORY_BASE / add_folder
-            stub_dir.mkdir(parents=True, exist_ok=True)
-            stub_file = stub_dir / filename
-
-            # Relative path from stub to primary
-            rel_path = f"../{primary_folder}/{filename}"
-
-            stub_content = create_stub_file(title, rel_path, created_at, additional_folders)
-            with open(stub_file, 'w') as f:
-                f.write(stub_content)
-
-            stats['stubs_created'] += 1
+        if rag is not None:
+            rag.add_meeting(doc_id, build_rag_chunks(doc_id, doc, primary_folder, doc_panels, transcript_lines))
+        dedup_tokens[doc_id] = dedup_token_hashes(doc, notes_md or notes_plain, transcript_lines, token_cache)
+        columns_changed = True
+
+        if changes is not None:
+            if is_new:
+                action = 'new'
+            elif prev_state.get('primary_folder') != primary_folder:
+                action = 'moved'
+            else:
+                action = 'updated'
+            changes.append({'doc_id': doc_id, 'action': action, 'title': title, 'folders': folders,
+                            'previous_folders': prev_state.get('all_folders', []), 'files': paths})
 
         # Update sync state
         sync_state['meetings'][doc_id] = {
             'title': title,
+            'file': filename,
+            'stem': stem,
+            'paths': paths,
+            'created_at': created_at,
+            'date': date,
+            'people': get_people(doc),
+            'summary_line': summary_first_line(doc.get('summary', '')),
+            'transcript_stats': transcript_stats,
+            'notes_len': len(notes_md or notes_plain or ''),
+            'transcript_len': transcript_length(transcript_lines),
             'primary_folder': primary_folder,
             'all_folders': folders,
             'last_updated_granola': updated_at,
+            'render': {'version': TEMPLATE_VERSION, 'input': render_input, 'outputs': outputs,
+                       'limit': sink.section_limit},
             'imported_at': datetime.now().isoformat()
         }
 
+        dirty_folders.update(folders)
+        dirty_folders.update(prev_state.get('all_folders', []))
+
+        if journal is not None:
+            pending.append(doc_id)
+            if len(pending) >= CHECKPOINT_EVERY:
+                sink.drain()
+                journal.record(sync_state, pending)
+                pending = []
+
+    phase_started = end_phase(stats, 'meetings', phase_started)
+
+    # Meetings deleted in Granola: their files or rows are removed, their
+    # stems released and their records dropped, so each is handled once
+    if selected is None:
+        deleted = {doc_id: meeting for doc_id, meeting in sync_state['meetings'].items()
+                   if doc_id not in live_doc_ids}
+        if deleted:
+            sink.delete_meetings(deleted, registry)
+            for doc_id, meeting in deleted.items():
+                del sync_state['meetings'][doc_id]
+                key = stem_key(meeting_stem(meeting))
+                if registry.get(key) == doc_id:
+                    del registry[key]
+                dirty_folders.update(meeting.get('all_folders', []))
+                if changes is not None and 'file' in meeting:
+                    changes.append({'doc_id': doc_id, 'action': 'deleted', 'title': meeting['title'],
+                                    'folders': [], 'previous_folders': meeting.get('all_folders', []),
+                                    'files': meeting_paths(meeting)})
+            stats['deleted'] = len(deleted)
+
+    # Notes about the markdown tree (people, duplicates, columns) aren't produced for
+    # other sinks; the notes are queued on the sink's writer, ahead of its final flush
+    if sink.writes_tree and not dry_run:
+        if people_changed or not (MEMORY_BASE / PEOPLE_NOTE).exists():
+            write_people_dashboard(sink.writer, sync_state)
+
+        # Near-duplicate detection, hashing only meetings without a signature;
+        # pairs are only searched again when a compared signature was added,
+        # removed or changed
+        for doc_id, sig in compute_minhashes(dedup_tokens).items():
+            if minhashes.get(doc_id) != sig:
+                minhashes[doc_id] = sig
+                minhashes_changed = True
+        for doc_id in [d for d in minhashes if d not in sync_state['meetings']]:
+            del minhashes[doc_id]
+            minhashes_changed = True
+        compared = {doc_id: sig for doc_id, sig in minhashes.items()
+                    if sig and doc_id in live_doc_ids and 'file' in sync_state['meetings'][doc_id]}
+        compared_signature = signature(sorted(compared))
+        pairs = [tuple(pair) for pair in dedup.get('pairs', [])]
+        if minhashes_changed or dedup.get('compared') != compared_signature:
+            pairs = find_duplicate_pairs(compared)
+            save_minhashes(minhashes, pairs, compared_signature)
+            write_duplicates_note(sink.writer, pairs, sync_state)
+        elif (bool(pairs) != (MEMORY_BASE / DUPLICATES_NOTE).exists()
+              or any(a in dedup_tokens or b in dedup_tokens for _, a, b in pairs)):
+            # Same pairs, but a listed meeting may have been renamed or moved
+            write_duplicates_note(sink.writer, pairs, sync_state)
+        stats['duplicates'] = len(pairs)
+
+        columns_signature = signature(sorted(live_doc_ids))
+        if (columns_changed or sync_state.get('columns_signature') != columns_signature
+                or not (COLUMNS_DIR / "meta.json").exists()):
+            write_columns(sync_state, live_doc_ids)
+            sync_state['columns_signature'] = columns_signature
+        phase_started = end_phase(stats, 'derived', phase_started)
+
+    sink.finish(sync_state, dirty_folders, stats)
+    phase_started = end_phase(stats, 'write', phase_started)
+
+    if dry_run:
+        return stats
+
+    if rag is not None:
+        log("🧩 Updating RAG chunk index...", Colors.BLUE)
+        stats.update(rag.finish(live_doc_ids))
+        end_phase(stats, 'rag', phase_started)
+
     # Update last sync time
     sync_state['last_sync'] = datetime.now().isoformat()
 
     return stats
 
+def signature(*parts):
+    """Short hash of a few metadata values"""
+    return hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=8).hexdigest()
+
+def field_signature(*values):
+    """Short hash of the full content of cache fields, fed one value at a time"""
+    digest = hashlib.blake2b(digest_size=8)
+    for value in values:
+        digest.update(json.dumps(value, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8'))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def spool_content(chunks):
+    """Render chunks into a temporary file, hashing them on the way
+
+    Returns (short hash of the content, its size in bytes, file positioned
+    at its start); the file stays in memory up to RENDER_SPOOL_SIZE.
+    """
+    import tempfile
+    spool = tempfile.SpooledTemporaryFile(max_size=RENDER_SPOOL_SIZE)
+    digest = hashlib.blake2b(digest_size=8)
+    for chunk in chunks:
+        data = chunk.encode('utf-8')
+        digest.update(data)
+        spool.write(data)
+    size = spool.tell()
+    spool.seek(0)
+    return digest.hexdigest(), size, spool
+
+def text_length(value):
+    """Length of a text field, 0 when missing"""
+    return len(value) if isinstance(value, str) else 0
+
+def build_snapshot(state, fingerprint, previous=None, meetings=None):
+    """Build a compact per-document snapshot of the cache
+
+    fingerprint is the cache_fingerprint() taken before the cache was read,
+    so the snapshot records the file it was actually built from.
+
+    Signatures are blake2b hashes of the content itself (notes including
+    the TipTap document, panel contents, every transcript segment).
+    Transcripts are hashed segment by segment rather than serialized whole.
+    Given the previous snapshot and the synced meetings, a document whose
+    updated_at, render-input hash, panel timestamps and transcript length
+    are all unchanged keeps its previous signatures, so a sync pays for
+    hashing only the documents that changed.
+    """
+    documents = state.get('documents', {})
+    transcripts = state.get('transcripts', {})
+    document_panels = state.get('documentPanels', {})
+
+    doc_to_folders = defaultdict(list)
+    for folder_id, doc_ids in state.get('documentLists', {}).items():
+        if isinstance(doc_ids, list):
+            for doc_id in doc_ids:
+                doc_to_folders[doc_id].append(folder_id)
+
+    previous_docs = previous['docs'] if previous else {}
+    docs = {}
+    for doc_id, doc in documents.items():
+        doc_panels = document_panels.get(doc_id, {})
+        if not isinstance(doc_panels, dict):
+            doc_panels = {}
+        transcript = transcripts.get(doc_id)
+        if not isinstance(transcript, list):
+            transcript = []
+
+        entry = {
+            't': doc.get('title', 'Untitled'),
+            'c': doc.get('created_at', ''),
+            'u': doc.get('updated_at', ''),
+            'd': bool(doc.get('deleted_at')),
+            'f': sorted(doc_to_folders.get(doc_id, [])),
+        }
+        docs[doc_id] = entry
+
+        carry_key = None
+        if meetings is not None:
+            carry_key = signature(
+                entry['u'], meetings.get(doc_id, {}).get('render', {}).get('input'), len(transcript),
+                sorted((panel_id, panel.get('updated_at')) for panel_id, panel in doc_panels.items()
+                       if isinstance(panel, dict))
+            )
+            entry['k'] = carry_key
+            before = previous_docs.get(doc_id)
+            if before is not None and before.get('k') == carry_key:
+                entry.update(n=before['n'], p=before['p'], x=before['x'])
+                continue
+
+        entry['n'] = field_signature(
+            doc.get('notes_markdown'), doc.get('notes_plain'), doc.get('notes'), doc.get('summary')
+        )
+        entry['p'] = {panel_id: field_signature(panel.get('title'), panel.get('content'))
+                      for panel_id, panel in doc_panels.items() if isinstance(panel, dict)}
+        entry['x'] = [len(transcript), field_signature(*transcript)] if transcript else None
+
+    folders = {
+        folder_id: metadata.get('title', 'Unknown Folder')
+        for folder_id, metadata in state.get('documentListsMetadata', {}).items()
+    }
+
+    size, mtime_ns = map(int, fingerprint.split()) if fingerprint else (None, None)
+    return {
+        'version': SNAPSHOT_VERSION,
+        'taken_at': datetime.now().isoformat(),
+        'cache': {
+            'size': size,
+            'mtime': mtime_ns / 1e9 if mtime_ns is not None else None,
+        },
+        'folders': folders,
+        'docs': docs,
+    }
+
+def write_docs_index(state, fingerprint):
+    """Write the read-only document index used by the src/utils query scripts
+
+    Layout: magic, 8-byte little-endian header length, JSON header, then one
+    compact JSON record per document. The header holds the cache size/mtime
+    it was built from and, newest first, each document's id, created_at,
+    record offset/length, title and note/summary/overview lengths, so
+    readers can mmap the file and decode only the records they print.
+    The size/mtime come from fingerprint, taken before the cache was read,
+    so a cache rewritten during the sync leaves the index marked stale.
+    """
+    documents = state.get('documents', {})
+    order = sorted(documents, key=lambda d: str(documents[d].get('created_at') or ''), reverse=True)
+
+    records = []
+    rows = []
+    offset = 0
+    for doc_id in order:
+        doc = documents[doc_id]
+        record = json.dumps({k: doc.get(k) for k in DOCS_INDEX_FIELDS if k in doc},
+                            separators=(',', ':')).encode('utf-8')
+        rows.append([doc_id, doc.get('created_at'), offset, len(record), doc.get('title'),
+                     text_length(doc.get('notes_markdown')), text_length(doc.get('summary')),
+                     text_length(doc.get('overview'))])
+        records.append(record)
+        offset += len(record)
+
+    size, mtime_ns = map(int, fingerprint.split())
+    header = json.dumps({
+        'cache': {'size': size, 'mtime_ns': mtime_ns},
+        'columns': ['id', 'created_at', 'offset', 'length', 'title', 'notes_len', 'summary_len', 'overview_len'],
+        'docs': rows,
+    }, separators=(',', ':')).encode('utf-8')
+
+    tmp_file = DOCS_INDEX_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(DOCS_INDEX_MAGIC)
+        f.write(len(header).to_bytes(8, 'little'))
+        f.write(header)
+        f.write(b''.join(records))
+    os.replace(tmp_file, DOCS_INDEX_FILE)
+
+def iso_to_epoch(date_str):
+    """ISO date string to epoch seconds, NaN if missing or unparseable"""
+    if not date_str or not isinstance(date_str, str):
+        return math.nan
+    try:
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return math.nan
+
+def write_columns(sync_state, doc_ids):
+    """Write the columnar snapshot of per-meeting metadata
+
+    One flat binary file per column (float64 'f8' or int32 'i4', native
+    byte order) plus meta.json with ids and dictionaries. Multi-valued
+    columns (folders, attendees) use CSR layout: <name>_offsets has
+    count+1 entries indexing into <name>_ids. Built entirely from sync
+    state, so it costs the same whether or not content changed.
+    src/utils/granola_columns.py loads it for vectorized queries.
+    """
+    ids = sorted(d for d in doc_ids if 'file' in sync_state['meetings'].get(d, {}))
+    folder_codes = {}
+    person_codes = {}
+
+    columns = {
+        'created': array('d'), 'updated': array('d'), 'primary_folder': array('i'),
+        'notes_len': array('i'), 'transcript_len': array('i'), 'talk_time': array('d'),
+        'folder_offsets': array('i', [0]), 'folder_ids': array('i'),
+        'attendee_offsets': array('i', [0]), 'attendee_ids': array('i'),
+    }
+
+    for doc_id in ids:
+        meeting = sync_state['meetings'][doc_id]
+        columns['created'].append(iso_to_epoch(meeting.get('created_at')))
+        columns['updated'].append(iso_to_epoch(meeting.get('last_updated_granola')))
+        columns['notes_len'].append(meeting.get('notes_len', 0))
+        columns['transcript_len'].append(meeting.get('transcript_len', 0))
+        stats = meeting.get('transcript_stats')
+        columns['talk_time'].append(sum(stats['talk']) if stats else 0.0)
+
+        columns['primary_folder'].append(folder_codes.setdefault(meeting['primary_folder'], len(folder_codes)))
+        for folder in meeting.get('all_folders', []):
+            columns['folder_ids'].append(folder_codes.setdefault(folder, len(folder_codes)))
+        columns['folder_offsets'].append(len(columns['folder_ids']))
+
+        for person in meeting.get('people', []):
+            columns['attendee_ids'].append(person_codes.setdefault(person, len(person_codes)))
+        columns['attendee_offsets'].append(len(columns['attendee_ids']))
+
+    COLUMNS_DIR.mkdir(parents=True, exist_ok=True)
+    for name, values in columns.items():
+        tmp_file = COLUMNS_DIR / f"{name}.tmp"
+        with open(tmp_file, 'wb') as f:
+            values.tofile(f)
+        os.replace(tmp_file, COLUMNS_DIR / f"{name}.bin")
+
+    meta = {
+        'version': COLUMNS_VERSION,
+        'built_at': datetime.now().isoformat(),
+        'count': len(ids),
+        'byteorder': sys.byteorder,
+        'columns': {name: 'f8' if values.typecode == 'd' else f"i{values.itemsize}"
+                    for name, values in columns.items()},
+        'ids': ids,
+        'folders': list(folder_codes),
+        'people': list(person_codes),
+    }
+    tmp_file = COLUMNS_DIR / "meta.tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(meta, f)
+    os.replace(tmp_file, COLUMNS_DIR / "meta.json")
+
+def write_snapshot(snapshot):
+    """Save a snapshot, keeping the previous one for 'diff --last'
+
+    The new snapshot is written to a temp file first, so an interrupted
+    write never leaves a truncated snapshot behind.
+    """
+    tmp_file = SNAPSHOT_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump(snapshot, f, separators=(',', ':'))
+    if SNAPSHOT_FILE.exists():
+        os.replace(SNAPSHOT_FILE, PREV_SNAPSHOT_FILE)
+    os.replace(tmp_file, SNAPSHOT_FILE)
+
+def load_snapshot(path):
+    """Load a snapshot file"""
+    with open(path, 'r') as f:
+        snapshot = json.load(f)
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version in {path}: {snapshot.get('version')}")
+    return snapshot
+
+def load_previous_snapshot():
+    """The last snapshot written, or None if missing or from another version"""
+    try:
+        return load_snapshot(SNAPSHOT_FILE)
+    except (OSError, ValueError):
+        return None
+
+def diff_snapshots(old, new):
+    """Compare two snapshots document by document"""
+    old_docs, new_docs = old['docs'], new['docs']
+    old_folders, new_folders = old.get('folders', {}), new.get('folders', {})
+
+    def folder_name(folder_id):
+        return new_folders.get(folder_id) or old_folders.get(folder_id) or folder_id
+
+    changes = {
+        'added': [],
+        'removed': [],
+        'deleted': [],
+        'modified': [],
+        'folders_renamed': [],
+        'folders_added': sorted(new_folders[f] for f in set(new_folders) - set(old_folders)),
+        'folders_removed': sorted(old_folders[f] for f in set(old_folders) - set(new_folders)),
+    }
+
+    for folder_id in set(old_folders) & set(new_folders):
+        if old_folders[folder_id] != new_folders[folder_id]:
+            changes['folders_renamed'].append([old_folders[folder_id], new_folders[folder_id]])
+
+    for doc_id in new_docs.keys() - old_docs.keys():
+        changes['added'].append({'id': doc_id, 'title': new_docs[doc_id]['t']})
+
+    for doc_id in old_docs.keys() - new_docs.keys():
+        changes['removed'].append({'id': doc_id, 'title': old_docs[doc_id]['t']})
+
+    for doc_id in old_docs.keys() & new_docs.keys():
+        before, after = old_docs[doc_id], new_docs[doc_id]
+        if before == after:
+            continue
+
+        if after['d'] and not before['d']:
+            changes['deleted'].append({'id': doc_id, 'title': after['t']})
+            continue
+
+        entry = {'id': doc_id, 'title': after['t'], 'changes': []}
+        if before['t'] != after['t']:
+            entry['changes'].append(f"title: {before['t']!r} → {after['t']!r}")
+        if before['n'] != after['n'] or before['u'] != after['u']:
+            entry['changes'].append(f"notes/metadata (updated_at {before['u']} → {after['u']})")
+
+        old_panels, new_panels = before['p'], after['p']
+        added_panels = len(new_panels.keys() - old_panels.keys())
+        removed_panels = len(old_panels.keys() - new_panels.keys())
+        changed_panels = sum(1 for p in old_panels.keys() & new_panels.keys() if old_panels[p] != new_panels[p])
+        if added_panels or removed_panels or changed_panels:
+            entry['changes'].append(
+                f"panels: +{added_panels} -{removed_panels} ~{changed_panels}"
+            )
+
+        if before['x'] != after['x']:
+            old_count = before['x'][0] if before['x'] else 0
+            new_count = after['x'][0] if after['x'] else 0
+            entry['changes'].append(f"transcript: {old_count} → {new_count} segments")
+
+        if before['f'] != after['f']:
+            joined = [folder_name(f) for f in set(after['f']) - set(before['f'])]
+            left = [folder_name(f) for f in set(before['f']) - set(after['f'])]
+            moves = [f"+{name}" for name in sorted(joined)] + [f"-{name}" for name in sorted(left)]
+            entry['changes'].append(f"folders: {' '.join(moves)}")
+
+        if entry['changes']:
+            changes['modified'].append(entry)
+
+    for key in ('added', 'removed', 'deleted', 'modified'):
+        changes[key].sort(key=lambda e: e['title'] or '')
+
+    return changes
+
+def print_diff(changes):
+    """Print a snapshot diff"""
+    total = sum(len(changes[k]) for k in ('added', 'removed', 'deleted', 'modified'))
+    if not total and not changes['folders_renamed'] and not changes['folders_added'] and not changes['folders_removed']:
+        log("✅ No changes", Colors.GREEN)
+        return
+
+    for name in changes['folders_added']:
+        log(f"📁 Folder added:   {name}", Colors.GREEN)
+    for name in changes['folders_removed']:
+        log(f"📁 Folder removed: {name}", Colors.RED)
+    for old_name, new_name in changes['folders_renamed']:
+        log(f"📁 Folder renamed: {old_name} → {new_name}", Colors.YELLOW)
+
+    for entry in changes['added']:
+        log(f"✨ Added:    {entry['title']} ({entry['id']})", Colors.GREEN)
+    for entry in changes['removed']:
+        log(f"🗑️  Removed:  {entry['title']} ({entry['id']})", Colors.RED)
+    for entry in changes['deleted']:
+        log(f"🗑️  Deleted:  {entry['title']} ({entry['id']})", Colors.RED)
+    for entry in changes['modified']:
+        log(f"🔄 Modified: {entry['title']} ({entry['id']})", Colors.BLUE)
+        for change in entry['changes']:
+            log(f"     {change}")
+
+    log(f"\n{len(changes['added'])} added, {len(changes['removed'])} removed, "
+        f"{len(changes['deleted'])} deleted, {len(changes['modified'])} modified", Colors.BOLD)
+
+def diff_command(args):
+    """Entry point for: import-granola-to-memory.py diff [OLD [NEW]]
+
+    With no arguments, compares the latest snapshot with the live cache.
+    --last compares the snapshots from before and after the last sync.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(prog='import-granola-to-memory.py diff',
+                                     description="Show what changed between Granola cache snapshots")
+    parser.add_argument('old', nargs='?', help=f"old snapshot (default: {SNAPSHOT_FILE.name})")
+    parser.add_argument('new', nargs='?', help="new snapshot (default: live cache)")
+    parser.add_argument('--last', action='store_true', help="diff the snapshots around the last sync")
+    parser.add_argument('--json', action='store_true', help="print the diff as JSON")
+    opts = parser.parse_args(args)
+
+    if opts.last:
+        old_path, new_path = PREV_SNAPSHOT_FILE, SNAPSHOT_FILE
+    else:
+        old_path, new_path = Path(opts.old) if opts.old else SNAPSHOT_FILE, opts.new and Path(opts.new)
+
+    for path in (old_path, new_path):
+        if path and not path.exists():
+            log(f"❌ Snapshot not found: {path}", Colors.RED)
+            sys.exit(1)
+
+    try:
+        old = load_snapshot(old_path)
+        new = load_snapshot(new_path) if new_path else None
+    except ValueError as e:
+        log(f"❌ {e}; run a sync to take a new snapshot", Colors.RED)
+        sys.exit(1)
+    if new is None:
+        fingerprint = cache_fingerprint()
+        with open(GRANOLA_CACHE, 'r') as f:
+            new = build_snapshot(json.loads(json.load(f)['cache'])['state'], fingerprint)
+
+    changes = diff_snapshots(old, new)
+    if opts.json:
+        print(json.dumps(changes, indent=2))
+    else:
+        log(f"🔍 {old_path.name} ({old['taken_at'][:19]}) → "
+            f"{new_path.name if new_path else 'live cache'} ({new['taken_at'][:19]})\n", Colors.BLUE)
+        print_diff(changes)
+
+# RAG export: content-addressed chunks plus a local vector index
+
+TOKEN_RE = re.compile(r"[\w']+")
+
+def get_numpy():
+    """NumPy if installed; the vector index falls back to pure Python without it"""
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+def split_into_chunks(text, limit=RAG_CHUNK_CHARS):
+    """Split text on paragraph boundaries into chunks of at most ~limit chars
+
+    text may also be a list of paragraphs (e.g. transcript lines), chunked
+    as if joined with blank lines.
+    """
+    pieces = []
+    texts = [text] if isinstance(text, str) else text
+    for para in (para for part in texts for para in re.split(r'\n\s*\n', part)):
+        para = para.strip()
+        while len(para) > limit:
+            cut = para.rfind(' ', 0, limit)
+            if cut <= 0:
+                cut = limit
+            pieces.append(para[:cut].strip())
+            para = para[cut:].strip()
+        if para:
+            pieces.append(para)
+
+    chunks = []
+    current = ''
+    for piece in pieces:
+        if current and len(current) + len(piece) + 2 > limit:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current}\n\n{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+def build_rag_chunks(doc_id, doc, folder, doc_panels, transcript_lines):
+    """Split a meeting into chunks whose id is a hash of their content"""
+    notes_md, notes_plain = get_private_notes(doc)
+    sections = [('summary', doc.get('summary', '')), ('private_notes', notes_md or notes_plain)]
+    for panel_title, panel_md in get_enhanced_notes(doc_panels):
+        sections.append((f"panel:{panel_title or 'Untitled'}", panel_md))
+    sections.append(('transcript', transcript_lines))
+
+    chunks = []
+    for section, text in sections:
+        if not text or not isinstance(text, (str, list)):
+            continue
+        for n, chunk_text in enumerate(split_into_chunks(text)):
+            chunk_id = hashlib.blake2b(
+                f"{doc_id}\0{section}\0{chunk_text}".encode('utf-8'), digest_size=16
+            ).hexdigest()
+            chunks.append({
+                'id': chunk_id,
+                'doc_id': doc_id,
+                'title': doc.get('title', 'Untitled'),
+                'created_at': doc.get('created_at', ''),
+                'folder': folder,
+                'section': section,
+                'n': n,
+                'text': chunk_text,
+            })
+    return chunks
+
+def hashing_embedder(texts, dim=RAG_DIM):
+    """Built-in local embedder: signed feature hashing of word tokens
+
+    Deterministic and dependency-free; good enough for keyword-ish recall.
+    Point GRANOLA_EMBEDDER at a real model for semantic search.
+    """
+    vectors = []
+    for text in texts:
+        vec = [0.0] * dim
+        for token in TOKEN_RE.findall(text.lower()):
+            h = zlib.crc32(token.encode('utf-8'))
+            vec[h % dim] += 1.0 if h & 0x80000000 else -1.0
+        norm = math.sqrt(sum(v * v for v in vec)) or 1.0
+        vectors.append([v / norm for v in vec])
+    return vectors
+
+def embedder_name():
+    """Name of the configured embedder, as recorded in the index metadata"""
+    return os.environ.get('GRANOLA_EMBEDDER') or f"hashing-{RAG_DIM}"
+
+def get_embedder():
+    """Return (name, function) for the configured embedding function
+
+    GRANOLA_EMBEDDER=module:function selects a custom function taking a list
+    of strings and returning one vector per string.
+    """
+    spec = os.environ.get('GRANOLA_EMBEDDER')
+    if not spec:
+        return embedder_name(), hashing_embedder
+
+    import importlib
+    module_name, _, func_name = spec.partition(':')
+    return spec, getattr(importlib.import_module(module_name), func_name or 'embed')
+
+class RagExporter:
+    """Maintains _rag/chunks.jsonl and the vector index alongside a sync
+
+    Chunks are kept per meeting; only meetings passed to add_meeting() are
+    re-chunked, and only chunk ids not already in the index are embedded.
+    """
+
+    BATCH_SIZE = 256
+
+    def __init__(self, base=RAG_DIR):
+        self.base = base
+        self.chunks_file = base / "chunks.jsonl"
+        self.meta_file = base / "vectors.json"
+        self.vectors_file = base / "vectors.f32"
+        self.doc_chunks = defaultdict(list)
+        self.changed = False
+
+        if self.chunks_file.exists():
+            with open(self.chunks_file, 'r') as f:
+                for line in f:
+                    chunk = json.loads(line)
+                    self.doc_chunks[chunk['doc_id']].append(chunk)
+
+    def needs_export(self, doc_id):
+        """True if a meeting has never been chunked"""
+        return doc_id not in self.doc_chunks
+
+    def add_meeting(self, doc_id, chunks):
+        """Replace a meeting's chunks"""
+        if [c['id'] for c in self.doc_chunks.get(doc_id, [])] != [c['id'] for c in chunks]:
+            self.changed = True
+        self.doc_chunks[doc_id] = chunks
+
+    def finish(self, live_doc_ids):
+        """Drop chunks of meetings no longer in the cache and update the index"""
+        for doc_id in list(self.doc_chunks):
+            if doc_id not in live_doc_ids:
+                del self.doc_chunks[doc_id]
+                self.changed = True
+
+        result = {'rag_chunks': sum(len(c) for c in self.doc_chunks.values()), 'rag_embedded': 0}
+        if not self.changed and self.index_embedder() == embedder_name():
+            return result
+
+        self.base.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.chunks_file.with_suffix('.tmp')
+        with open(tmp_file, 'w') as f:
+            for doc_id in sorted(self.doc_chunks):
+                for chunk in self.doc_chunks[doc_id]:
+                    f.write(json.dumps(chunk) + '\n')
+        os.replace(tmp_file, self.chunks_file)
+
+        result['rag_embedded'] = self.update_vectors()
+        return result
+
+    def index_embedder(self):
+        """Embedder the vector index was built with, or None if there is no index"""
+        try:
+            with open(self.meta_file, 'r') as f:
+                return json.load(f).get('embedder')
+        except (OSError, ValueError):
+            return None
+
+    def load_vectors(self):
+        """Return (metadata, flat float array) of the current index"""
+        if not self.meta_file.exists() or not self.vectors_file.exists():
+            return None, array('f')
+        with open(self.meta_file, 'r') as f:
+            meta = json.load(f)
+        vectors = array('f')
+        with open(self.vectors_file, 'rb') as f:
+            vectors.frombytes(f.read())
+        if meta.get('byteorder') != sys.byteorder:
+            vectors.byteswap()
+        return meta, vectors
+
+    def update_vectors(self):
+        """Embed new chunk ids, reuse vectors for the rest; returns count embedded"""
+        name, embed = get_embedder()
+        meta, old_vectors = self.load_vectors()
+
+        old_rows = {}
+        dim = None
+        if meta and meta.get('embedder') == name:
+            dim = meta['dim']
+            old_rows = {chunk_id: row for row, chunk_id in enumerate(meta['ids'])}
+
+        texts = {}
+        for chunks in self.doc_chunks.values():
+            for chunk in chunks:
+                texts.setdefault(chunk['id'], chunk['text'])
+        ids = sorted(texts)
+
+        missing = [chunk_id for chunk_id in ids if chunk_id not in old_rows]
+        embedded = {}
+        for start in range(0, len(missing), self.BATCH_SIZE):
+            batch = missing[start:start + self.BATCH_SIZE]
+            for chunk_id, vector in zip(batch, embed([texts[c] for c in batch])):
+                embedded[chunk_id] = vector
+                dim = dim or len(vector)
+
+        vectors = array('f')
+        for chunk_id in ids:
+            if chunk_id in embedded:
+                vectors.extend(embedded[chunk_id])
+            else:
+                row = old_rows[chunk_id]
+                vectors.extend(old_vectors[row * dim:(row + 1) * dim])
+
+        tmp_file = self.vectors_file.with_suffix('.tmp')
+        with open(tmp_file, 'wb') as f:
+            vectors.tofile(f)
+        os.replace(tmp_file, self.vectors_file)
+
+        tmp_file = self.meta_file.with_suffix('.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump({'embedder': name, 'dim': dim or RAG_DIM, 'byteorder': sys.byteorder, 'ids': ids}, f)
+        os.replace(tmp_file, self.meta_file)
+
+        self.build_ivf(vectors, len(ids), dim)
+        return len(embedded)
+
+    def build_ivf(self, vectors, count, dim):
+        """Cluster vectors into an inverted-file index for large archives (NumPy only)"""
+        ivf_file = self.base / "ivf.npz"
+        np = get_numpy()
+        if np is None or count < RAG_IVF_MIN_VECTORS:
+            if ivf_file.exists():
+                ivf_file.unlink()
+            return
+
+        data = np.frombuffer(vectors.tobytes(), dtype=np.float32).reshape(count, dim)
+        nlist = int(math.sqrt(count))
+        rng = np.random.default_rng(0)
+        centroids = data[rng.choice(count, nlist, replace=False)].copy()
+        for _ in range(8):
+            assign = np.argmax(data @ centroids.T, axis=1)
+            for cluster in range(nlist):
+                members = data[assign == cluster]
+                if len(members):
+                    centroid = members.mean(axis=0)
+                    centroids[cluster] = centroid / (np.linalg.norm(centroid) or 1.0)
+        assign = np.argmax(data @ centroids.T, axis=1)
+
+        with open(ivf_file, 'wb') as f:
+            np.savez(f, centroids=centroids, assign=assign.astype(np.int32))
+
+    def search(self, query, k=5):
+        """Return the k chunks most similar to query as (score, chunk) pairs"""
+        import heapq
+        meta, vectors = self.load_vectors()
+        if not meta or not meta['ids']:
+            return []
+
+        name, embed = get_embedder()
+        if meta['embedder'] != name:
+            raise ValueError(f"Index was built with embedder {meta['embedder']}, not {name}")
+
+        dim, ids = meta['dim'], meta['ids']
+        query_vec = embed([query])[0]
+
+        np = get_numpy()
+        if np is not None:
+            data = np.frombuffer(vectors.tobytes(), dtype=np.float32).reshape(len(ids), dim)
+            q = np.asarray(query_vec, dtype=np.float32)
+            rows = np.arange(len(ids))
+            ivf_file = self.base / "ivf.npz"
+            if ivf_file.exists():
+                ivf = np.load(ivf_file)
+                if len(ivf['assign']) == len(ids):
+                    probes = np.argsort(ivf['centroids'] @ q)[-RAG_IVF_PROBES:]
+                    rows = np.nonzero(np.isin(ivf['assign'], probes))[0]
+            scores = data[rows] @ q
+            top = np.argsort(scores)[::-1][:k]
+            hits = [(float(scores[i]), ids[rows[i]]) for i in top]
+        else:
+            hits = heapq.nlargest(k, (
+                (sum(a * b for a, b in zip(vectors[row * dim:(row + 1) * dim], query_vec)), chunk_id)
+                for row, chunk_id in enumerate(ids)
+            ))
+
+        by_id = {chunk['id']: chunk for chunks in self.doc_chunks.values() for chunk in chunks}
+        return [(score, by_id[chunk_id]) for score, chunk_id in hits if chunk_id in by_id]
+
+def search_command(args):
+    """Entry point for: import-granola-to-memory.py search QUERY"""
+    import argparse
+    parser = argparse.ArgumentParser(prog='import-granola-to-memory.py search',
+                                     description="Search the RAG chunk index built by 'sync --rag'")
+    parser.add_argument('query', nargs='+')
+    parser.add_argument('-k', type=int, default=5, help="number of results (default: 5)")
+    parser.add_argument('--json', action='store_true', help="print results as JSON lines")
+    opts = parser.parse_args(args)
+
+    rag = RagExporter()
+    try:
+        results = rag.search(' '.join(opts.query), opts.k)
+    except ValueError as e:
+        log(f"❌ {e}; run a sync with --rag to re-embed the chunks with the current embedder", Colors.RED)
+        sys.exit(1)
+    if not results:
+        log("No results (run a sync with --rag to build the index)", Colors.YELLOW)
+        return
+
+    for score, chunk in results:
+        if opts.json:
+            print(json.dumps(dict(chunk, score=score)))
+            continue
+        log(f"{score:.3f}  {chunk['title']} ({format_date(chunk['created_at'])}) — {chunk['section']}", Colors.BOLD)
+        snippet = ' '.join(chunk['text'].split())
+        log(f"       {snippet[:200]}{'…' if len(snippet) > 200 else ''}\n")
+
+def run_account(account, flags, report):
+    """Sync one account in a child process; returns (account, returncode, output, passes)
+
+    The child appends one JSON line per sync pass to the report file, so
+    passes is empty when it ran none (--plan, --check, or a sync already
+    running for that output took the request over).
+    """
+    import subprocess
+    env = dict(os.environ, GRANOLA_CACHE=account['cache'], GRANOLA_MEMORY_BASE=account['output'],
+               GRANOLA_REPORT=str(report))
+    result = subprocess.run([sys.executable, os.path.abspath(__file__)] + flags, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    passes = []
+    if report.exists():
+        with open(report, 'r') as f:
+            passes = [json.loads(line) for line in f if line.strip()]
+    return account, result.returncode, result.stdout, passes
+
+def accounts_command(args):
+    """Entry point for: import-granola-to-memory.py accounts CONFIG [sync flags]
+
+    CONFIG is a JSON file listing the (cache, output) pairs to sync:
+        {"workers": 4, "accounts": [{"name": "alex", "cache": "~/...", "output": "~/..."}]}
+    Each account is synced by its own process, since parsing and
+    rendering are CPU-bound, with at most `workers` running at once.
+    Largest caches start first so the run ends close to the slowest
+    account's time. Other flags (--force, --rag, --fsync=...) are passed on.
+    """
+    import argparse
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    parser = argparse.ArgumentParser(prog='import-granola-to-memory.py accounts',
+                                     description="Sync several Granola caches concurrently")
+    parser.add_argument('config', help="JSON file listing accounts")
+    parser.add_argument('--workers', type=int, help="concurrent syncs (default: config value or CPU count)")
+    opts, flags = parser.parse_known_args(args)
+
+    with open(opts.config, 'r') as f:
+        config = json.load(f)
+
+    accounts = []
+    for i, account in enumerate(config.get('accounts', [])):
+        if not account.get('cache') or not account.get('output'):
+            log(f"❌ Account {i + 1} needs both 'cache' and 'output'", Colors.RED)
+            sys.exit(2)
+        cache = Path(account['cache']).expanduser()
+        accounts.append({
+            'name': account.get('name') or f"account-{i + 1}",
+            'cache': str(cache),
+            'output': str(Path(account['output']).expanduser()),
+            'size': cache.stat().st_size if cache.exists() else 0,
+        })
+    accounts.sort(key=lambda a: -a['size'])
+
+    workers = opts.workers or config.get('workers') or os.cpu_count() or 1
+    log(f"🍯 Syncing {len(accounts)} accounts with {workers} workers", Colors.BOLD)
+
+    started = time.monotonic()
+    failed = 0
+    with tempfile.TemporaryDirectory(prefix='granola-accounts-') as reports, \
+            ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_account, account, flags, Path(reports) / f"{i}.jsonl")
+                   for i, account in enumerate(accounts)]
+        for future in as_completed(futures):
+            account, returncode, output, passes = future.result()
+            if returncode != 0:
+                failed += 1
+                log(f"❌ {account['name']}: exit {returncode}", Colors.RED)
+                log('\n'.join(output.rstrip().splitlines()[-10:]))
+                continue
+            if not passes:
+                log(f"⏭️  {account['name']}: no sync ran", Colors.YELLOW)
+                log('\n'.join(output.rstrip().splitlines()[-10:]))
+                continue
+
+            # Counts add up over the passes; unchanged is the last pass's view
+            new = sum(p['stats'].get('new', 0) for p in passes)
+            updated = sum(p['stats'].get('updated', 0) for p in passes)
+            files = sum(p['stats'].get('io', {}).get('open', 0) for p in passes)
+            note = f" in {len(passes)} passes" if len(passes) > 1 else ""
+            log(f"✅ {account['name']}: {sum(p['seconds'] for p in passes):.1f}s{note} — {new} new, "
+                f"{updated} updated, {passes[-1]['stats'].get('unchanged', 0)} unchanged, "
+                f"{files} files written ({passes[-1]['sink']})", Colors.GREEN)
+
+    log(f"\n⏱️  {len(accounts)} accounts in {time.monotonic() - started:.1f}s", Colors.BOLD)
+    if failed:
+        sys.exit(1)
+
+# Near-duplicate detection: one-permutation MinHash + LSH banding
+
+DEDUP_BINS = DEDUP_BANDS * DEDUP_ROWS
+EMPTY_BIN = 0xFFFFFFFF
+MASK64 = (1 << 64) - 1
+SHINGLE_MULT_1 = 0x9E3779B97F4A7C15
+SHINGLE_MULT_2 = 0xC2B2AE3D27D4EB4F
+MIX_MULT = 0xBF58476D1CE4E5B9
+
+def dedup_token_hashes(doc, notes, transcript_lines, token_cache):
+    """CRC32 of each word compared for near-duplicates: summary, private notes, transcript
+
+    token_cache maps words already seen to their hash.
+    """
+    parts = [p for p in (doc.get('summary', ''), notes) if isinstance(p, str) and p]
+    hashes = array('I')
+    for text in chain(parts, transcript_lines):
+        for token in TOKEN_RE.findall(text.lower()):
+            h = token_cache.get(token)
+            if h is None:
+                h = token_cache[token] = zlib.crc32(token.encode('utf-8'))
+            hashes.append(h)
+    return hashes
+
+def compute_minhashes(tokens):
+    """MinHash signatures for {doc_id: token hashes}, computed in one batch
+
+    Word 3-shingles are hashed to 64 bits; the low bits pick one of
+    DEDUP_BINS bins and each bin keeps its minimum (one-permutation
+    MinHash). With NumPy the shingling and binning for all meetings is
+    vectorized; otherwise the same arithmetic runs per shingle in Python.
+    Signatures are DEDUP_BINS big-endian uint32s packed into bytes;
+    meetings with too little text get an empty signature.
+    """
+    signatures = {doc_id: b'' for doc_id, hashes in tokens.items() if len(hashes) < DEDUP_MIN_TOKENS}
+    tokens = {doc_id: hashes for doc_id, hashes in tokens.items() if doc_id not in signatures}
+
+    if not tokens:
+        return signatures
+
+    doc_ids = list(tokens)
+    np = get_numpy()
+    if np is not None:
+        lengths = np.array([len(tokens[d]) for d in doc_ids])
+        t = np.concatenate([np.frombuffer(tokens[d], dtype=np.uint32) for d in doc_ids]).astype(np.uint64)
+        owner = np.repeat(np.arange(len(doc_ids)), lengths)
+        valid = owner[:-2] == owner[2:]  # shingles must not span two meetings
+
+        h = t[:-2] * np.uint64(SHINGLE_MULT_1) + t[1:-1] * np.uint64(SHINGLE_MULT_2) + t[2:]
+        h ^= h >> np.uint64(31)
+        h *= np.uint64(MIX_MULT)
+        h ^= h >> np.uint64(29)
+        h, owner = h[valid], owner[:-2][valid]
+
+        keys = owner * DEDUP_BINS + (h % np.uint64(DEDUP_BINS)).astype(np.int64)
+        values = (h >> np.uint64(8)) & np.uint64(EMPTY_BIN)
+        sig = np.full(len(doc_ids) * DEDUP_BINS, EMPTY_BIN, dtype=np.uint64)
+        np.minimum.at(sig, keys, values)
+        sig = sig.reshape(len(doc_ids), DEDUP_BINS).astype('>u4')
+        for row, doc_id in enumerate(doc_ids):
+            signatures[doc_id] = sig[row].tobytes()
+        return signatures
+
+    for doc_id in doc_ids:
+        t = tokens[doc_id]
+        sig = [EMPTY_BIN] * DEDUP_BINS
+        for i in range(len(t) - 2):
+            h = (t[i] * SHINGLE_MULT_1 + t[i + 1] * SHINGLE_MULT_2 + t[i + 2]) & MASK64
+            h ^= h >> 31
+            h = (h * MIX_MULT) & MASK64
+            h ^= h >> 29
+            b = h % DEDUP_BINS
+            v = (h >> 8) & EMPTY_BIN
+            if v < sig[b]:
+                sig[b] = v
+        signatures[doc_id] = b''.join(v.to_bytes(4, 'big') for v in sig)
+    return signatures
+
+def minhash_similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two packed MinHash signatures"""
+    equal = union = 0
+    for i in range(0, len(sig_a), 4):
+        va, vb = sig_a[i:i + 4], sig_b[i:i + 4]
+        if va == b'\xff\xff\xff\xff' and vb == b'\xff\xff\xff\xff':
+            continue
+        union += 1
+        if va == vb:
+            equal += 1
+    return equal / union if union else 0.0
+
+def find_duplicate_pairs(signatures, threshold=DEDUP_THRESHOLD):
+    """Near-duplicate pairs via LSH banding; returns [(similarity, id_a, id_b)]
+
+    Signatures sharing any band of DEDUP_ROWS values land in the same
+    bucket; only those candidate pairs are compared in full.
+    """
+    band_bytes = DEDUP_ROWS * 4
+    empty_band = b'\xff' * band_bytes
+    buckets = defaultdict(list)
+    for doc_id, sig in signatures.items():
+        if not sig:
+            continue
+        for band in range(DEDUP_BANDS):
+            key = sig[band * band_bytes:(band + 1) * band_bytes]
+            if key != empty_band:
+                buckets[(band, key)].append(doc_id)
+
+    candidates = set()
+    for members in buckets.values():
+        if len(members) > 1:
+            members.sort()
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    candidates.add((a, b))
+
+    pairs = []
+    for a, b in candidates:
+        similarity = minhash_similarity(signatures[a], signatures[b])
+        if similarity >= threshold:
+            pairs.append((similarity, a, b))
+    pairs.sort(key=lambda p: (-p[0], p[1], p[2]))
+    return pairs
+
+def load_minhashes():
+    """MinHash signatures and the last duplicate search, from MINHASH_FILE
+
+    Returns ({doc_id: signature}, header); both are empty when the file is
+    missing, unreadable or was written with a different number of bins.
+    """
+    try:
+        data = MINHASH_FILE.read_bytes()
+    except OSError:
+        return {}, {}
+    if not data.startswith(MINHASH_MAGIC):
+        return {}, {}
+    start = len(MINHASH_MAGIC) + 8
+    offset = start + int.from_bytes(data[start - 8:start], 'little')
+    try:
+        header = json.loads(data[start:offset])
+    except ValueError:
+        return {}, {}
+    if header.get('bins') != DEDUP_BINS:
+        return {}, {}
+    size = DEDUP_BINS * 4
+    signatures = {doc_id: b'' for doc_id in header['short']}
+    for i, doc_id in enumerate(header['ids']):
+        signatures[doc_id] = data[offset + i * size:offset + (i + 1) * size]
+    return signatures, header
+
+def save_minhashes(signatures, pairs, compared):
+    """Write MINHASH_FILE atomically
+
+    Layout: magic, 8-byte little-endian header length, JSON header (bins,
+    ids, ids too short to sign, the pairs found and a signature of the
+    compared ids), then DEDUP_BINS big-endian uint32s per id in header order.
+    """
+    ids = sorted(doc_id for doc_id, sig in signatures.items() if sig)
+    header = json.dumps({
+        'bins': DEDUP_BINS,
+        'ids': ids,
+        'short': sorted(doc_id for doc_id, sig in signatures.items() if not sig),
+        'compared': compared,
+        'pairs': [list(pair) for pair in pairs],
+    }, separators=(',', ':')).encode('utf-8')
+
+    tmp_file = MINHASH_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(MINHASH_MAGIC)
+        f.write(len(header).to_bytes(8, 'little'))
+        f.write(header)
+        f.write(b''.join(signatures[doc_id] for doc_id in ids))
+    os.replace(tmp_file, MINHASH_FILE)
+
+def write_duplicates_note(writer, pairs, sync_state):
+    """Queue _duplicates.md listing near-duplicate meetings (or its removal)"""
+    note = MEMORY_BASE / DUPLICATES_NOTE
+    if not pairs:
+        writer.unlink(note)
+        return
+
+    def link(doc_id):
+        meeting = sync_state['meetings'][doc_id]
+        stem = meeting['file'][:-3] if meeting['file'].endswith('.md') else meeting['file']
+        date = meeting.get('date') or format_date(meeting.get('created_at'))
+        return f"[[{meeting['primary_folder']}/{stem}|{meeting['title']}]] ({date})"
+
+    content = "# Possible Duplicate Meetings\n\n"
+    content += f"Meetings whose notes and transcripts are at least {DEDUP_THRESHOLD:.0%} similar.\n\n"
+    for similarity, a, b in pairs:
+        content += f"- {link(a)} ↔ {link(b)} — {similarity:.0%} similar\n"
+
+    writer.write(note, content)
+
 def print_report(stats):
     """Print sync report"""
     log("\n" + "="*80, Colors.BOLD)
@@ -500,7 +2911,23 @@ def print_report(stats):
     log(f"🔄 Updated meetings:    {stats['updated']}", Colors.BLUE)
     log(f"⏭️  Unchanged meetings:  {stats['unchanged']}", Colors.YELLOW)
     log(f"📎 Stub files created:  {stats['stubs_created']}", Colors.GREEN)
+    if stats['stubs_deleted']:
+        log(f"🗑️  Stale stubs removed: {stats['stubs_deleted']}", Colors.YELLOW)
+    if stats.get('deleted'):
+        log(f"🗑️  Deleted in Granola: {stats['deleted']}", Colors.YELLOW)
     log(f"🎤 Transcripts added:   {stats['transcripts_added']}", Colors.GREEN)
+    io = stats.get('io', {})
+    if io.get('open') or io.get('unlink'):
+        log(f"💾 Files written:       {io['open']} ({io['bytes'] / 1024:.0f} KB; syscalls: {io['mkdir']} mkdir, "
+            f"{io['open']} open, {io['write']} write, {io['fsync']} fsync, {io['unlink']} unlink)", Colors.GREEN)
+    if 'sink' in stats:
+        log(f"🗄️  Output:              {stats['sink']}", Colors.GREEN)
+    else:
+        log(f"📇 Folder indexes:      {stats['folder_indexes']}", Colors.GREEN)
+    if stats.get('duplicates'):
+        log(f"👯 Possible duplicates: {stats['duplicates']} (see {DUPLICATES_NOTE})", Colors.YELLOW)
+    if 'rag_chunks' in stats:
+        log(f"🧩 RAG chunks:          {stats['rag_chunks']} ({stats['rag_embedded']} embedded)", Colors.GREEN)
 
     total = stats['new'] + stats['updated'] + stats['unchanged']
     log(f"\n📁 Total meetings:      {total}", Colors.BOLD)
@@ -508,31 +2935,403 @@ def print_report(stats):
 
     log("\n" + "="*80, Colors.BOLD)
 
+def peak_rss_mb():
+    """Peak resident memory of this process in MB, or None where unavailable"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes on Linux
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+def append_metrics(stats, started, fingerprint, sink_name, force, partial):
+    """Append this run's record to METRICS_FILE"""
+    io = stats.get('io', {})
+    record = {
+        'v': METRICS_VERSION,
+        'at': started.isoformat(timespec='seconds'),
+        'seconds': round((datetime.now() - started).total_seconds(), 3),
+        'phases': stats['phases'],
+        'meetings': stats['new'] + stats['updated'] + stats['unchanged'],
+        'new': stats['new'],
+        'updated': stats['updated'],
+        'transcripts': stats['transcripts_added'],
+        'files_written': io.get('open', 0),
+        'bytes_written': io.get('bytes', 0),
+        'cache_bytes': int(fingerprint.split()[0]) if fingerprint else None,
+        'peak_rss_mb': peak_rss_mb(),
+        'sink': sink_name,
+        'force': force,
+        'partial': partial,
+    }
+    try:
+        with open(METRICS_FILE, 'a') as f:
+            f.write(json.dumps(record, separators=(',', ':')) + "\n")
+    except OSError as e:
+        log(f"⚠️  Could not append to {METRICS_FILE.name}: {e}", Colors.YELLOW)
+
+def load_metrics(path=METRICS_FILE):
+    """Run records from the metrics log, oldest first (unreadable lines are skipped)"""
+    runs = []
+    if path.exists():
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    run = json.loads(line)
+                except ValueError:
+                    continue
+                if run.get('v') == METRICS_VERSION:
+                    runs.append(run)
+    return runs
+
+def find_regressions(runs, window, threshold, min_seconds=1.0):
+    """{run index: (baseline seconds, slowest phase)} for runs slower than their baseline
+
+    A run's baseline is the median duration of the previous `window` runs
+    of the same kind (sink, --force, partial), so a forced re-import is
+    never compared with an incremental sync. A run is flagged when it
+    took more than threshold x baseline and at least min_seconds longer.
+    """
+    from statistics import median
+    history = defaultdict(list)
+    flagged = {}
+    for i, run in enumerate(runs):
+        kind = (run.get('sink'), run.get('force'), run.get('partial'))
+        previous = history[kind][-window:]
+        if len(previous) >= 3:
+            baseline = median(r['seconds'] for r in previous)
+            if run['seconds'] > threshold * baseline and run['seconds'] - baseline >= min_seconds:
+                # The phase that grew the most over its own baseline
+                growth = {}
+                for phase, seconds in run.get('phases', {}).items():
+                    growth[phase] = seconds - median(r.get('phases', {}).get(phase, 0) for r in previous)
+                slowest = max(growth, key=growth.get) if growth else None
+                flagged[i] = (baseline, slowest)
+        history[kind].append(run)
+    return flagged
+
+def stats_command(args):
+    """Entry point for: import-granola-to-memory.py stats
+
+    Shows recent runs from the metrics log with duration, phases, cache
+    size and memory, and flags runs much slower than their baseline.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(prog='import-granola-to-memory.py stats',
+                                     description="Show sync run history and flag slow runs")
+    parser.add_argument('-n', '--runs', type=int, default=20, help="runs to show (default: 20)")
+    parser.add_argument('--window', type=int, default=10, help="runs in the rolling baseline (default: 10)")
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help="flag runs slower than this multiple of the baseline (default: 1.5)")
+    parser.add_argument('--json', action='store_true', help="print the runs and flags as JSON")
+    opts = parser.parse_args(args)
+
+    runs = load_metrics()
+    if not runs:
+        log(f"No runs recorded yet in {METRICS_FILE}", Colors.YELLOW)
+        return
+
+    flagged = find_regressions(runs, opts.window, opts.threshold)
+    first = max(0, len(runs) - opts.runs)
+
+    if opts.json:
+        shown = []
+        for i in range(first, len(runs)):
+            run = dict(runs[i])
+            if i in flagged:
+                run['regression'] = {'baseline_seconds': round(flagged[i][0], 3), 'phase': flagged[i][1]}
+            shown.append(run)
+        print(json.dumps(shown, indent=2))
+        return
+
+    log(f"{'run':19s} {'kind':12s} {'secs':>7s} {'meetings':>8s} {'changed':>7s} {'written':>9s} "
+        f"{'cache':>9s} {'rss':>7s}  slowest phase", Colors.BOLD)
+    for i in range(first, len(runs)):
+        run = runs[i]
+        kind = run.get('sink', 'files') + (' force' if run.get('force') else '') + \
+            (' partial' if run.get('partial') else '')
+        phases = run.get('phases', {})
+        slowest = max(phases, key=phases.get) if phases else ''
+        cache = f"{run['cache_bytes'] / 1e6:.1f} MB" if run.get('cache_bytes') else '-'
+        rss = f"{run['peak_rss_mb']:.0f} MB" if run.get('peak_rss_mb') else '-'
+        line = (f"{run['at'][:19]:19s} {kind:12s} {run['seconds']:7.1f} {run['meetings']:8d} "
+                f"{run['new'] + run['updated']:7d} {run['bytes_written'] / 1e6:6.1f} MB {cache:>9s} {rss:>7s}  ")
+        if slowest:
+            line += f"{slowest} {phases[slowest]:.1f}s"
+        if i in flagged:
+            baseline, phase = flagged[i]
+            log(f"{line}  ⚠️  {run['seconds'] / baseline:.1f}x baseline {baseline:.1f}s ({phase})", Colors.RED)
+        else:
+            log(line)
+
+    # Trend across the runs shown: is sync time keeping pace with cache growth?
+    shown = runs[first:]
+    sized = [run for run in shown if run.get('cache_bytes')]
+    if len(sized) >= 2:
+        old, new = sized[0], sized[-1]
+        log(f"\n📈 Cache {old['cache_bytes'] / 1e6:.1f} → {new['cache_bytes'] / 1e6:.1f} MB "
+            f"({new['cache_bytes'] / old['cache_bytes'] - 1:+.0%}); "
+            f"{old['meetings']} → {new['meetings']} meetings; "
+            f"load {old['phases'].get('load', 0):.1f}s → {new['phases'].get('load', 0):.1f}s over {len(shown)} runs",
+            Colors.BLUE)
+    recent = [i for i in flagged if i >= first]
+    if recent:
+        log(f"⚠️  {len(recent)} slow run(s) (> {opts.threshold:g}x the median of the previous "
+            f"{opts.window} comparable runs)", Colors.YELLOW)
+    else:
+        log("✅ No slow runs", Colors.GREEN)
+
+COMMANDS = {
+    'accounts': accounts_command,
+    'diff': diff_command,
+    'search': search_command,
+    'stats': stats_command,
+}
+
+def print_plan(changes, stats, as_json=False):
+    """Print what a sync would do, as text or JSON"""
+    io = stats['io']
+    summary = {
+        'new': stats['new'],
+        'updated': sum(1 for c in changes if c['action'] == 'updated'),
+        'moved': sum(1 for c in changes if c['action'] == 'moved'),
+        'deleted': sum(1 for c in changes if c['action'] == 'deleted'),
+        'unchanged': stats['unchanged'],
+        'stubs': stats['stubs_created'],
+        'stubs_removed': stats['stubs_deleted'],
+        'transcripts': stats['transcripts_added'],
+        'folder_indexes': stats['folder_indexes'],
+        'files_written': io['open'],
+        'files_deleted': io['unlink'],
+        'directories_created': io['mkdir'],
+        'bytes': io['bytes'],
+    }
+    if as_json:
+        print(json.dumps({'summary': summary, 'meetings': changes}, indent=2))
+        return
+
+    log("\n" + "="*80, Colors.BOLD)
+    log("🧭 SYNC PLAN (nothing has been written)", Colors.BOLD)
+    log("="*80, Colors.BOLD)
+
+    icons = {'new': '✨', 'updated': '🔄', 'moved': '📦', 'deleted': '🗑️ '}
+    for change in changes:
+        line = f"{icons[change['action']]} {change['action']:8s} {change['title']}"
+        if change['action'] == 'moved':
+            line += f" ({change['previous_folders'][0]} → {change['folders'][0]})"
+        elif change['folders']:
+            line += f" ({', '.join(change['folders'])})"
+        log(line)
+
+    log(f"\n✨ New: {summary['new']}  🔄 Updated: {summary['updated']}  📦 Moved: {summary['moved']}  "
+        f"🗑️  Deleted in Granola: {summary['deleted']}  ⏭️  Unchanged: {summary['unchanged']}",
+        Colors.BOLD)
+    log(f"💾 Would write {summary['files_written']} files ({summary['bytes'] / 1024:.0f} KB) — "
+        f"{summary['stubs']} stubs, {summary['transcripts']} transcripts, {summary['folder_indexes']} folder indexes; "
+        f"delete {summary['files_deleted']}; create {summary['directories_created']} directories", Colors.BOLD)
+
+def plan_command(force, selection, as_json=False, section_limit=None):
+    """Entry point for --plan: run the sync engine against a dry-run writer
+
+    Change detection and rendering are exactly those of a real sync, so
+    the file counts and byte totals are exact; nothing is written and the
+    sync state is not saved. A journal left by an interrupted sync is
+    replayed into the loaded state first, as the next sync would.
+    With --json, progress goes to stderr.
+    """
+    import contextlib
+    with contextlib.redirect_stdout(sys.stderr if as_json else sys.stdout):
+        log("🧭 Planning sync (dry run)...", Colors.BOLD)
+        state = load_granola_data()
+        sync_state = load_sync_state()
+        journal = SyncJournal(dry_run=True)
+        resumed = journal.replay(sync_state)
+        if resumed:
+            log(f"♻️  Interrupted sync found: {resumed} meetings already written", Colors.YELLOW)
+        changes = []
+        stats = sync_meetings(state, sync_state, force, sink=FileSink(OutputWriter(dry_run=True), section_limit),
+                              changes=changes, selection=selection, journal=journal)
+    print_plan(changes, stats, as_json)
+
+def flag_values(name):
+    """All values given as --name=value or --name value"""
+    values = []
+    args = sys.argv[1:]
+    for i, arg in enumerate(args):
+        if arg.startswith(name + '='):
+            values.append(arg[len(name) + 1:])
+        elif arg == name and i + 1 < len(args):
+            values.append(args[i + 1])
+    return values
+
+def flag_value(name, default, choices):
+    """Value of a --name=value argument, exiting on an invalid choice"""
+    for value in flag_values(name):
+        if value not in choices:
+            log(f"❌ {name} must be one of: {', '.join(choices)}", Colors.RED)
+            sys.exit(2)
+        return value
+    return default
+
+def parse_section_limit():
+    """--max-section-kb as a byte limit (UTF-8) per notes section, or None"""
+    values = flag_values('--max-section-kb')
+    if not values:
+        return None
+    try:
+        limit = int(values[-1])
+    except ValueError:
+        limit = 0
+    if limit <= 0:
+        log("❌ --max-section-kb must be a positive number", Colors.RED)
+        sys.exit(2)
+    return limit * 1024
+
+def parse_selection():
+    """--folder/--since/--until/--doc filters for a selective sync"""
+    selection = {
+        'folders': flag_values('--folder'),
+        'docs': flag_values('--doc'),
+        'since': (flag_values('--since') or [None])[-1],
+        'until': (flag_values('--until') or [None])[-1],
+    }
+    for name in ('since', 'until'):
+        if selection[name]:
+            try:
+                datetime.strptime(selection[name][:10], '%Y-%m-%d')
+            except ValueError:
+                log(f"❌ --{name} must be a date (YYYY-MM-DD)", Colors.RED)
+                sys.exit(2)
+    return selection
+
 def main():
     """Main entry point"""
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        COMMANDS[sys.argv[1]](sys.argv[2:])
+        return
+
+    if '--check' in sys.argv:
+        check_command()
+
+    if '--plan' in sys.argv:
+        plan_command('--force' in sys.argv, parse_selection(), as_json='--json' in sys.argv,
+                     section_limit=parse_section_limit())
+        return
+
+    force = '--force' in sys.argv
+    fsync = flag_value('--fsync', 'none', FSYNC_MODES)
+    selection = parse_selection()
+    rag = '--rag' in sys.argv
+    io_thread = '--io-thread' in sys.argv
+    sink = (flag_value('--sink', 'files', SINKS), Path((flag_values('--db') or [SQLITE_DB])[-1]), sys.stdout,
+            parse_section_limit())
+
+    # One sync at a time per output tree; a sync that finds one running asks
+    # it for one more pass instead of rewriting the same files concurrently
+    lock = RunLock()
+    if not lock.acquire():
+        PENDING_FILE.touch()
+        if not lock.acquire():
+            log(f"⏳ A sync is already running (pid {lock.holder()}); "
+                f"it will run one more pass for this request", Colors.YELLOW)
+            return
+
+    # The jsonl sink owns stdout; progress goes to stderr
+    import contextlib
+    with contextlib.redirect_stdout(sys.stderr if sink[0] == 'jsonl' else sys.stdout):
+        while True:
+            try:
+                take_pending()
+                run_sync(force, fsync, selection, rag, io_thread, sink)
+                while take_pending():
+                    log("🔁 Another sync was requested meanwhile; running one more pass", Colors.BLUE)
+                    run_sync(False, fsync, None, rag, io_thread, sink)
+            finally:
+                lock.release()
+
+            # A request can land between the last check and the release
+            if not PENDING_FILE.exists() or not lock.acquire():
+                break
+            force, selection = False, None
+
+def open_sink(sink, fsync, io_thread):
+    """Output sink for a (name, sqlite path, stream, section limit) --sink choice"""
+    name, db_path, stream, section_limit = sink
+    if name == 'sqlite':
+        return SqliteSink(db_path)
+    if name == 'jsonl':
+        return JsonlSink(stream)
+    return FileSink(OutputWriter(fsync=fsync, threaded=io_thread), section_limit)
+
+def run_sync(force, fsync, selection, rag_enabled, io_thread, sink=('files', SQLITE_DB, None, None)):
+    """One sync pass: load, sync, save state and derived files, report"""
     log("\n" + "="*80, Colors.BOLD)
     log("🍯 Granola → Basic Memory Sync", Colors.BOLD)
     log("="*80 + "\n", Colors.BOLD)
 
-    # Check for force flag
-    force = '--force' in sys.argv
+    partial = bool(selection) and any(selection.values())
     if force:
         log("⚠️  Force mode: Re-importing all meetings", Colors.YELLOW)
 
-    # Load data
+    # Load data (fingerprint first, so a cache written mid-sync triggers another run)
+    started = datetime.now()
+    load_started = time.monotonic()
+    fingerprint = cache_fingerprint()
     state = load_granola_data()
-    sync_state = load_sync_state()
+    sink = open_sink(sink, fsync, io_thread)
+    sync_state = load_sync_state(sink.state_file)
 
     if sync_state.get('last_sync'):
         log(f"📅 Last sync: {sync_state['last_sync'][:19]}", Colors.BLUE)
     else:
         log("📅 First sync - importing all meetings", Colors.BLUE)
 
-    # Sync
-    stats = sync_meetings(state, sync_state, force)
+    # Optional chunk export for RAG tools
+    rag = RagExporter() if rag_enabled else None
+
+    # Pick up where an interrupted sync left off
+    journal = SyncJournal(sink.journal_file)
+    resumed = journal.replay(sync_state)
+    if resumed:
+        log(f"♻️  Resuming interrupted sync: {resumed} meetings already written", Colors.YELLOW)
 
-    # Save state
-    save_sync_state(sync_state)
+    load_seconds = round(time.monotonic() - load_started, 3)
+
+    # Sync
+    stats = sync_meetings(state, sync_state, force, rag, sink, selection=selection, journal=journal)
+    stats['phases'] = dict({'load': load_seconds}, **stats['phases'])
+    save_started = time.monotonic()
+
+    # Save state, with this run's metrics
+    sync_state['last_run'] = {
+        'started_at': started.isoformat(),
+        'seconds': round((datetime.now() - started).total_seconds(), 3),
+        'stats': stats,
+    }
+    save_sync_state(sync_state, sink.state_file)
+    journal.clear()
+    if sink.writes_tree:
+        write_docs_index(state, fingerprint)
+        if not partial:
+            # A selective sync leaves other meetings behind; keep --check and
+            # diff pointing at the last full sync. An unchanged cache already
+            # has its snapshot (and keeps the pair diff --last compares)
+            if fingerprint != synced_fingerprint():
+                write_snapshot(build_snapshot(state, fingerprint, load_previous_snapshot(),
+                                              sync_state['meetings']))
+                write_fingerprint(fingerprint)
+    end_phase(stats, 'save', save_started)
+
+    # One line per run in the metrics log, for the stats command
+    append_metrics(stats, started, fingerprint, sink.name, force, partial)
+
+    # The accounts command reads each child's passes from here
+    report = os.environ.get('GRANOLA_REPORT')
+    if report:
+        with open(report, 'a') as f:
+            f.write(json.dumps({'sink': sink.name, 'seconds': sync_state['last_run']['seconds'],
+                                'stats': stats}) + "\n")
 
     # Print report
     print_report(stats)
@@ -8,11 +8,16 @@ import json
 import os
 from pathlib import Path
 from datetime import datetime
+from collections import defaultdict
 import sys
 
+from granola_progress import Progress
+
 # Paths
-GRANOLA_CACHE = Path.home() / "Library/Application Support/Granola/cache-v3.json"
+GRANOLA_CACHE = Path(os.environ.get('GRANOLA_CACHE') or
+                     Path.home() / "Library/Application Support/Granola/cache-v3.json").expanduser()
 OUTPUT_DIR = Path.home() / "granola-full-export"
+INDEX_STATE_FILE = ".index-state.json"
 
 def load_granola_data():
     """Load and parse the Granola cache file"""
@@ -69,13 +74,18 @@ def extract_transcript(transcript_data, doc_id):
     return None
 
 def export_documents(state, output_dir):
-    """Export all documents with full data"""
+    """Export all documents with full data
+
+    Returns index entries (doc_id -> title/file/month) for every exported
+    markdown document, so the index can be built without re-reading files.
+    """
     documents = state.get('documents', {})
     transcripts = state.get('transcripts', {})
+    index_entries = {}
 
     if not documents:
         print("❌ No documents found")
-        return
+        return index_entries
 
     print(f"📝 Found {len(documents)} documents")
     print(f"🎤 Found {len(transcripts)} transcripts")
@@ -91,8 +101,10 @@ def export_documents(state, output_dir):
     # Export each document
     exported_count = 0
     skipped_count = 0
+    written = {'bytes': 0}
 
-    for doc_id, doc in documents.items():
+    progress = Progress('export', len(documents), bytes_done=lambda: written['bytes'])
+    for doc_id, doc in progress.track(documents.items()):
         # Skip deleted documents
         if doc.get('deleted_at'):
             skipped_count += 1
@@ -137,6 +149,13 @@ def export_documents(state, output_dir):
                 # Notes
                 f.write(f"\n## Notes\n\n")
                 f.write(notes_markdown or notes_plain or "No notes")
+                written['bytes'] += f.tell()
+
+            index_entries[doc_id] = {
+                'title': title,
+                'file': f"documents/{filename}.md",
+                'month': date_prefix[:7] if created_at else 'undated',
+            }
 
         # Export transcript if available
         transcript_ref = doc.get('transcribe')
@@ -157,14 +176,14 @@ def export_documents(state, output_dir):
                         f.write(f"Created: {format_date(created_at)}\n")
                         f.write(f"\n{'-'*80}\n\n")
                         f.write(transcript_text)
+                        written['bytes'] += f.tell()
 
         # Export full metadata as JSON
         with open(metadata_dir / f"{filename}_metadata.json", 'w') as f:
             json.dump(doc, f, indent=2)
+            written['bytes'] += f.tell()
 
         exported_count += 1
-        if exported_count % 50 == 0:
-            print(f"  Exported {exported_count} documents...")
 
     print(f"\n✅ Exported {exported_count} documents")
     print(f"⏭️  Skipped {skipped_count} deleted documents")
@@ -177,6 +196,8 @@ def export_documents(state, output_dir):
             json.dump(transcripts, f, indent=2)
         print(f"   Saved to: {raw_transcripts_file}")
 
+    return index_entries
+
 def export_people(state, output_dir):
     """Export people/contacts"""
     people = state.get('people', {})
@@ -207,32 +228,85 @@ def export_events(state, output_dir):
 
     print(f"   Saved to: {events_file}")
 
-def create_index(output_dir):
-    """Create an index of all exported documents"""
-    docs_dir = output_dir / "documents"
-
-    if not docs_dir.exists():
-        return
-
-    md_files = sorted(docs_dir.glob("*.md"))
+def load_index_state(index_dir):
+    """Load index entries recorded by the previous export"""
+    state_file = index_dir / INDEX_STATE_FILE
+    if state_file.exists():
+        try:
+            with open(state_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+    return {}
+
+def write_month_index(index_dir, month, entries):
+    """Write the index page for one month"""
+    month_file = index_dir / f"{month}.md"
+    entries = sorted(entries, key=lambda e: e['file'])
+    with open(month_file, 'w') as f:
+        f.write(f"# Granola Export Index: {month}\n\n")
+        f.write(f"**Documents:** {len(entries)}\n\n")
+        f.write("[← All months](../INDEX.md)\n\n")
+        for entry in entries:
+            f.write(f"- [{entry['title']}](../{entry['file']})\n")
+
+def create_index(output_dir, index_entries):
+    """Create an index of all exported documents
+
+    Built from the entries returned by export_documents() instead of
+    re-reading every exported file. The index is partitioned into one page
+    per month under index/, and only months whose entries changed since the
+    last export are rewritten; INDEX.md itself just lists the months.
+    """
+    index_dir = output_dir / "index"
+    index_dir.mkdir(parents=True, exist_ok=True)
+
+    previous = load_index_state(index_dir)
+
+    # Group current and previous entries by month
+    months = defaultdict(list)
+    for entry in index_entries.values():
+        months[entry['month']].append(entry)
+
+    # Only months with added, removed or changed entries need rewriting
+    dirty_months = set()
+    for doc_id in set(previous) | set(index_entries):
+        old = previous.get(doc_id)
+        new = index_entries.get(doc_id)
+        if old != new:
+            if old:
+                dirty_months.add(old['month'])
+            if new:
+                dirty_months.add(new['month'])
+
+    for month in dirty_months:
+        if month in months:
+            write_month_index(index_dir, month, months[month])
+        else:
+            month_file = index_dir / f"{month}.md"
+            if month_file.exists():
+                month_file.unlink()
+
+    # Rewrite any month page that went missing since the last export
+    for month in months:
+        if month not in dirty_months and not (index_dir / f"{month}.md").exists():
+            write_month_index(index_dir, month, months[month])
 
     index_file = output_dir / "INDEX.md"
     with open(index_file, 'w') as f:
         f.write("# Granola Export Index\n\n")
         f.write(f"**Exported:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
-        f.write(f"**Total Documents:** {len(md_files)}\n\n")
-        f.write("## Documents\n\n")
+        f.write(f"**Total Documents:** {len(index_entries)}\n\n")
+        f.write("## Months\n\n")
 
-        for md_file in md_files:
-            # Read first line (title)
-            with open(md_file, 'r') as doc:
-                first_line = doc.readline().strip()
-                title = first_line.replace('# ', '')
+        for month in sorted(months, reverse=True):
+            f.write(f"- [{month}](index/{month}.md) ({len(months[month])} documents)\n")
 
-            rel_path = md_file.relative_to(output_dir)
-            f.write(f"- [{title}]({rel_path})\n")
+    with open(index_dir / INDEX_STATE_FILE, 'w') as f:
+        json.dump(index_entries, f)
 
     print(f"\n📋 Created index: {index_file}")
+    print(f"   Updated {len(dirty_months)} of {len(months)} month pages")
 
 def main():
     print("=" * 80)
@@ -254,10 +328,10 @@ def main():
     print(f"📁 Output directory: {OUTPUT_DIR}\n")
 
     # Export everything
-    export_documents(state, OUTPUT_DIR)
+    index_entries = export_documents(state, OUTPUT_DIR)
     export_people(state, OUTPUT_DIR)
     export_events(state, OUTPUT_DIR)
-    create_index(OUTPUT_DIR)
+    create_index(OUTPUT_DIR, index_entries)
 
     print("\n" + "=" * 80)
     print("✨ Export complete!")
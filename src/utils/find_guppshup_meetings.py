@@ -1,22 +1,9 @@
 #!/usr/bin/env python3
-import json
 import re
 
-# Load the cache file
-cache_path = "/Users/arjunmalhotra/Library/Application Support/Granola/cache-v3.json"
+from granola_cache import open_documents
 
-with open(cache_path, 'r') as f:
-    data = json.load(f)
-
-# Double-JSON decoding
-cache_data = json.loads(data['cache'])
-state = cache_data.get('state', {})
-
-documents_raw = state.get('documents', [])
-if isinstance(documents_raw, dict):
-    documents = list(documents_raw.values())
-else:
-    documents = documents_raw
+documents = open_documents()
 
 print("=" * 80)
 print("GUPPSHUP-RELATED MEETINGS")
@@ -27,7 +14,13 @@ print()
 search_terms = ['guppshup', 'gupshup', 'aman']
 matches = []
 
-for meeting in documents:
+# Scan the raw records once and only decode documents that could match
+candidates = documents.find_rows(re.compile(
+    b'|'.join(re.escape(term.encode()) for term in search_terms), re.IGNORECASE
+))
+
+for row in candidates:
+    meeting = documents.load(row)
     title = (meeting.get('title') or '').lower()
     notes_markdown = (meeting.get('notes_markdown') or '').lower()
     summary = (meeting.get('summary') or '').lower()
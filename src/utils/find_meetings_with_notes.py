@@ -1,38 +1,25 @@
 #!/usr/bin/env python3
-import json
+from granola_cache import open_documents
 
-# Load the cache file
-cache_path = "/Users/arjunmalhotra/Library/Application Support/Granola/cache-v3.json"
-
-with open(cache_path, 'r') as f:
-    data = json.load(f)
-
-# Double-JSON decoding
-cache_data = json.loads(data['cache'])
-state = cache_data.get('state', {})
-
-documents_raw = state.get('documents', [])
-if isinstance(documents_raw, dict):
-    documents = list(documents_raw.values())
-else:
-    documents = documents_raw
+documents = open_documents()
 
 print(f"Total meetings: {len(documents)}")
 print("\nLooking for meetings with notes...\n")
 print("=" * 80)
 
 count = 0
-for meeting in documents:
-    # Check if has notes
-    notes_markdown = meeting.get('notes_markdown', '')
-    summary = meeting.get('summary', '')
-    overview = meeting.get('overview', '')
-
-    if (notes_markdown and len(notes_markdown) > 50) or \
-       (summary and len(summary) > 50) or \
-       (overview and len(overview) > 50):
+for row in documents.rows:
+    # Check if has notes (lengths come from the index, no decoding needed)
+    if documents.column(row, 'notes_len') > 50 or \
+       documents.column(row, 'summary_len') > 50 or \
+       documents.column(row, 'overview_len') > 50:
         count += 1
         if count <= 5:  # Show first 5 meetings with notes
+            meeting = documents.load(row)
+            notes_markdown = meeting.get('notes_markdown', '')
+            summary = meeting.get('summary', '')
+            overview = meeting.get('overview', '')
+
             print(f"\nMeeting #{count}")
             print("-" * 80)
             print(f"Title: {meeting.get('title', 'Untitled')}")
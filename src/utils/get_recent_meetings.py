@@ -2,28 +2,14 @@
 """
 Quick script to get recent meetings from Granola cache
 """
-import json
 from datetime import datetime
 
-# Load the cache file
-cache_path = "/Users/arjunmalhotra/Library/Application Support/Granola/cache-v3.json"
+from granola_cache import open_documents
 
-with open(cache_path, 'r') as f:
-    data = json.load(f)
+documents = open_documents()
 
-# Double-JSON decoding (Granola's cache structure)
-cache_data = json.loads(data['cache'])
-state = cache_data.get('state', {})
-
-documents_raw = state.get('documents', [])
-# Convert documents to list if it's a dict
-if isinstance(documents_raw, dict):
-    documents = list(documents_raw.values())
-else:
-    documents = documents_raw
-
-# Get the 5 most recent meetings
-recent_meetings = documents[:5]
+# Get the 5 most recent meetings (the index is ordered newest first)
+recent_meetings = [documents.load(row) for row in documents.rows[:5]]
 
 print("=" * 80)
 print("RECENT MEETINGS FROM GRANOLA")
@@ -40,9 +26,11 @@ for i, meeting in enumerate(recent_meetings, 1):
     updated_at = meeting.get('updated_at')
     if created_at:
         # Convert from timestamp to readable date
-        from datetime import datetime
         try:
-            dt = datetime.fromtimestamp(created_at / 1000)  # Assuming milliseconds
+            if isinstance(created_at, str):
+                dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+            else:
+                dt = datetime.fromtimestamp(created_at / 1000)  # Assuming milliseconds
             print(f"Date: {dt.strftime('%Y-%m-%d %H:%M')}")
         except:
             print(f"Date: {created_at}")
@@ -5,7 +5,6 @@ Fetches meeting data directly from Granola's cloud API
 """
 
 import json
-import requests
 from pathlib import Path
 from datetime import datetime, timedelta
 import sys
@@ -50,6 +49,9 @@ class GranolaAPIClient:
 
     def _make_request(self, endpoint, method='GET', data=None):
         """Make authenticated API request"""
+        # Imported here so cache-only callers don't pay for loading requests
+        import requests
+
         headers = {
             'Authorization': f'Bearer {self.access_token}',
             'Content-Type': 'application/json'
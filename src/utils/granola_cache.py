@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Fast read-only access to Granola documents
+Memory-maps the document index written by import-granola-to-memory.py and
+decodes only the documents that are asked for. Falls back to parsing the
+full cache when the index is missing or older than the cache.
+"""
+
+import json
+import mmap
+import os
+import sys
+from pathlib import Path
+
+# Same locations and overrides as import-granola-to-memory.py
+GRANOLA_CACHE = Path(os.environ.get('GRANOLA_CACHE') or
+                     Path.home() / "Library/Application Support/Granola/cache-v3.json").expanduser()
+MEMORY_BASE = Path(os.environ.get('GRANOLA_MEMORY_BASE') or Path.home() / "basic-memory/Granola").expanduser()
+DOCS_INDEX_FILE = MEMORY_BASE / ".granola-docs.bin"
+DOCS_INDEX_MAGIC = b"GRDOCS1\n"
+
+class DocumentIndex:
+    """Documents from the mmapped index, newest first"""
+
+    def __init__(self, path=DOCS_INDEX_FILE):
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mm[:len(DOCS_INDEX_MAGIC)] != DOCS_INDEX_MAGIC:
+            raise ValueError(f"Not a Granola document index: {path}")
+
+        header_start = len(DOCS_INDEX_MAGIC) + 8
+        header_len = int.from_bytes(self._mm[len(DOCS_INDEX_MAGIC):header_start], 'little')
+        header = json.loads(self._mm[header_start:header_start + header_len])
+
+        self._data_start = header_start + header_len
+        self.cache = header['cache']
+        self.rows = header['docs']
+        self.columns = {name: i for i, name in enumerate(header['columns'])}
+        self._by_id = None
+
+    def is_fresh(self, cache_path=GRANOLA_CACHE):
+        """True if the index was built from the current cache file"""
+        try:
+            stat = os.stat(cache_path)
+        except OSError:
+            return True  # No cache to compare against; the index is all we have
+        return stat.st_size == self.cache['size'] and stat.st_mtime_ns == self.cache['mtime_ns']
+
+    def __len__(self):
+        return len(self.rows)
+
+    def column(self, row, name):
+        """Value of a header column (e.g. 'title', 'notes_len') for a row"""
+        return row[self.columns[name]]
+
+    def load(self, row):
+        """Decode the full record for a header row"""
+        offset = self._data_start + row[self.columns['offset']]
+        return json.loads(self._mm[offset:offset + row[self.columns['length']]])
+
+    def get(self, doc_id):
+        """Decode a single document by id, or None"""
+        if self._by_id is None:
+            self._by_id = {row[0]: row for row in self.rows}
+        row = self._by_id.get(doc_id)
+        return self.load(row) if row else None
+
+    def __iter__(self):
+        for row in self.rows:
+            yield self.load(row)
+
+    def find_rows(self, pattern):
+        """Rows whose record bytes match a compiled bytes regex
+
+        The regex runs over the mmapped records in one pass; matches are
+        mapped back to documents by offset.
+        """
+        from bisect import bisect_right
+        offsets = sorted((row[self.columns['offset']], i) for i, row in enumerate(self.rows))
+        starts = [offset for offset, _ in offsets]
+
+        found = []
+        seen = set()
+        for match in pattern.finditer(self._mm, self._data_start):
+            pos = bisect_right(starts, match.start() - self._data_start) - 1
+            row_idx = offsets[pos][1]
+            if row_idx not in seen:
+                seen.add(row_idx)
+                found.append(row_idx)
+        return [self.rows[i] for i in sorted(found)]
+
+class FullCacheDocuments:
+    """Same interface as DocumentIndex, backed by a full parse of the cache"""
+
+    columns = {name: i for i, name in enumerate(
+        ['id', 'created_at', 'offset', 'length', 'title', 'notes_len', 'summary_len', 'overview_len'])}
+
+    def __init__(self, cache_path=GRANOLA_CACHE):
+        with open(cache_path, 'r') as f:
+            data = json.load(f)
+
+        # Double-JSON decoding (Granola's cache structure)
+        state = json.loads(data['cache']).get('state', {})
+        documents = state.get('documents', {})
+        if isinstance(documents, list):
+            documents = {doc.get('id', str(i)): doc for i, doc in enumerate(documents)}
+
+        self.documents = documents
+        order = sorted(documents, key=lambda d: str(documents[d].get('created_at') or ''), reverse=True)
+        self.rows = []
+        for doc_id in order:
+            doc = documents[doc_id]
+            self.rows.append([doc_id, doc.get('created_at'), None, None, doc.get('title'),
+                              _length(doc.get('notes_markdown')), _length(doc.get('summary')),
+                              _length(doc.get('overview'))])
+
+    def is_fresh(self, cache_path=GRANOLA_CACHE):
+        return True
+
+    def __len__(self):
+        return len(self.rows)
+
+    def column(self, row, name):
+        return row[self.columns[name]]
+
+    def load(self, row):
+        return self.documents[row[0]]
+
+    def get(self, doc_id):
+        return self.documents.get(doc_id)
+
+    def __iter__(self):
+        for row in self.rows:
+            yield self.load(row)
+
+    def find_rows(self, pattern):
+        return [row for row in self.rows
+                if pattern.search(json.dumps(self.documents[row[0]]).encode('utf-8'))]
+
+def _length(value):
+    return len(value) if isinstance(value, str) else 0
+
+def open_documents():
+    """Open the fastest up-to-date source of Granola documents"""
+    if DOCS_INDEX_FILE.exists():
+        try:
+            index = DocumentIndex()
+            if index.is_fresh():
+                return index
+            print("⚠️  Document index is older than the Granola cache; "
+                  "reading the full cache (run a sync to refresh it)", file=sys.stderr)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not read document index: {e}", file=sys.stderr)
+    return FullCacheDocuments()
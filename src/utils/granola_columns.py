@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Analytics over the columnar meeting snapshot
+Loads the typed column files written by import-granola-to-memory.py
+(~/basic-memory/Granola/.granola-columns/) and answers filter / group-by
+questions without parsing the Granola cache or any meeting notes.
+Uses NumPy when it is installed; otherwise falls back to the array module.
+
+Examples:
+    granola_columns.py count --by folder
+    granola_columns.py count --by month --since 2025-01-01
+    granola_columns.py mean notes_len --by attendee --folder "Sales"
+"""
+
+import argparse
+import json
+import os
+import sys
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+
+MEMORY_BASE = Path(os.environ.get('GRANOLA_MEMORY_BASE') or Path.home() / "basic-memory/Granola").expanduser()
+COLUMNS_DIR = MEMORY_BASE / ".granola-columns"
+COLUMNS_VERSION = 1
+VALUE_COLUMNS = ['notes_len', 'transcript_len', 'talk_time']
+GROUP_KEYS = ['folder', 'primary_folder', 'attendee', 'month', 'year']
+
+def get_numpy():
+    """NumPy if installed, else None"""
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+class MeetingColumns:
+    """Column arrays for every synced meeting, in meta.json id order"""
+
+    def __init__(self, path=COLUMNS_DIR, np=None):
+        with open(path / "meta.json", 'r') as f:
+            meta = json.load(f)
+        if meta.get('version') != COLUMNS_VERSION:
+            raise ValueError(f"Unsupported column snapshot version {meta.get('version')} (re-run the sync)")
+
+        self.np = np
+        self.meta = meta
+        self.ids = meta['ids']
+        self.folders = meta['folders']
+        self.people = meta['people']
+        self.count = meta['count']
+        swap = meta['byteorder'] != sys.byteorder
+
+        self.columns = {}
+        for name, dtype in meta['columns'].items():
+            file_path = path / f"{name}.bin"
+            if np is not None:
+                values = np.fromfile(file_path, dtype=np.dtype(dtype))
+                if swap:
+                    values = values.byteswap()
+            else:
+                values = array('d' if dtype == 'f8' else 'i')
+                with open(file_path, 'rb') as f:
+                    values.frombytes(f.read())
+                if swap:
+                    values.byteswap()
+            self.columns[name] = values
+
+    def rows(self, since=None, until=None, folder=None, attendee=None):
+        """Row numbers matching all given filters (dates as epoch seconds)"""
+        created = self.columns['created']
+        if self.np is not None:
+            np = self.np
+            mask = np.ones(self.count, dtype=bool)
+            if since is not None:
+                mask &= created >= since
+            if until is not None:
+                mask &= created < until
+            if folder is not None:
+                mask &= self._has_value('folder', self._code(self.folders, folder))
+            if attendee is not None:
+                mask &= self._has_value('attendee', self._code(self.people, attendee))
+            return np.flatnonzero(mask)
+
+        rows = range(self.count)
+        if since is not None:
+            rows = [i for i in rows if created[i] >= since]
+        if until is not None:
+            rows = [i for i in rows if created[i] < until]
+        if folder is not None:
+            code = self._code(self.folders, folder)
+            rows = [i for i in rows if code in self._values('folder', i)]
+        if attendee is not None:
+            code = self._code(self.people, attendee)
+            rows = [i for i in rows if code in self._values('attendee', i)]
+        return list(rows)
+
+    def _code(self, names, name):
+        return names.index(name) if name in names else -1
+
+    def _values(self, name, row):
+        """Codes of a multi-valued (CSR) column for one row"""
+        offsets = self.columns[f"{name}_offsets"]
+        return self.columns[f"{name}_ids"][offsets[row]:offsets[row + 1]]
+
+    def _has_value(self, name, code):
+        """Boolean mask of rows whose CSR column contains a code (NumPy only)"""
+        np = self.np
+        offsets = self.columns[f"{name}_offsets"]
+        hits = np.zeros(len(self.columns[f"{name}_ids"]) + 1, dtype=np.int64)
+        hits[1:] = np.cumsum(self.columns[f"{name}_ids"] == code)
+        return hits[offsets[1:]] > hits[offsets[:-1]]
+
+    def keys(self, by, rows):
+        """(row, label) pairs for a group key; multi-valued keys yield one pair per value"""
+        if by == 'primary_folder':
+            column = self.columns['primary_folder']
+            return [(i, self.folders[column[i]]) for i in rows]
+        if by in ('folder', 'attendee'):
+            names = self.folders if by == 'folder' else self.people
+            return [(i, names[code]) for i in rows for code in self._values(by, i)]
+        if by in ('month', 'year'):
+            fmt = '%Y-%m' if by == 'month' else '%Y'
+            created = self.columns['created']
+            labels = {}
+            pairs = []
+            for i in rows:
+                ts = float(created[i])
+                if ts != ts:  # NaN: missing date
+                    pairs.append((i, 'unknown'))
+                    continue
+                # Bucket by day so each distinct date is formatted once
+                day = int(ts // 86400)
+                if day not in labels:
+                    labels[day] = datetime.fromtimestamp(ts, timezone.utc).strftime(fmt)
+                pairs.append((i, labels[day]))
+            return pairs
+        raise ValueError(f"Unknown group key: {by}")
+
+    def group_count(self, by, rows):
+        """{label tuple: meeting count} grouped by one or more keys"""
+        if self.np is not None:
+            labels, inverse, _ = self._group_codes(by, rows)
+            counts = self.np.bincount(inverse, minlength=len(labels))
+            return {label: int(n) for label, n in zip(labels, counts)}
+
+        groups = {}
+        for key in self._group_keys(by, rows):
+            groups[key[1:]] = groups.get(key[1:], 0) + 1
+        return groups
+
+    def group_mean(self, value, by, rows):
+        """{label tuple: (mean, count)} of a value column grouped by one or more keys"""
+        column = self.columns[value]
+        if self.np is not None:
+            np = self.np
+            labels, inverse, entry_rows = self._group_codes(by, rows)
+            counts = np.bincount(inverse, minlength=len(labels))
+            totals = np.bincount(inverse, weights=column[entry_rows].astype(np.float64), minlength=len(labels))
+            return {label: (float(total) / n, int(n)) for label, total, n in zip(labels, totals, counts)}
+
+        sums = {}
+        for key in self._group_keys(by, rows):
+            total, n = sums.get(key[1:], (0.0, 0))
+            sums[key[1:]] = (total + float(column[key[0]]), n + 1)
+        return {label: (total / n, n) for label, (total, n) in sums.items()}
+
+    def _key_codes(self, by, rows):
+        """(positions, codes, names) for one group key (NumPy only)
+
+        positions index into rows, one entry per label (multi-valued keys
+        give several entries per row, in row order); codes index names.
+        """
+        np = self.np
+        positions = np.arange(len(rows))
+        if by == 'primary_folder':
+            return positions, self.columns['primary_folder'][rows], self.folders
+        if by in ('folder', 'attendee'):
+            offsets = self.columns[f"{by}_offsets"]
+            counts = offsets[rows + 1] - offsets[rows]
+            entries = _expand(np, offsets[rows], counts)
+            return np.repeat(positions, counts), self.columns[f"{by}_ids"][entries], \
+                self.folders if by == 'folder' else self.people
+        if by in ('month', 'year'):
+            fmt = '%Y-%m' if by == 'month' else '%Y'
+            created = self.columns['created'][rows]
+            missing = np.isnan(created)
+            # Bucket by day so each distinct date is formatted once
+            days, day_index = np.unique(np.floor(created[~missing] / 86400), return_inverse=True)
+            day_labels = [datetime.fromtimestamp(day * 86400, timezone.utc).strftime(fmt) for day in days]
+            names = sorted(set(day_labels)) + ['unknown']
+            lookup = {name: code for code, name in enumerate(names)}
+            codes = np.full(len(rows), len(names) - 1, dtype=np.int64)
+            codes[~missing] = np.array([lookup[label] for label in day_labels], dtype=np.int64)[day_index]
+            return positions, codes, names
+        raise ValueError(f"Unknown group key: {by}")
+
+    def _group_codes(self, by, rows):
+        """(label tuples, group of each entry, row of each entry) for the cross
+        product of the keys' labels per row, via np.unique (NumPy only)"""
+        np = self.np
+        rows = np.asarray(rows, dtype=np.int64)
+        positions = np.arange(len(rows))
+        codes = []
+        names = []
+        for key in by:
+            key_positions, key_codes, key_names = self._key_codes(key, rows)
+            # Join on position: each entry so far pairs with each of its row's labels
+            key_counts = np.bincount(key_positions, minlength=len(rows))
+            key_starts = np.cumsum(key_counts) - key_counts
+            pairs = key_counts[positions]
+            entries = _expand(np, key_starts[positions], pairs)
+            previous = np.repeat(np.arange(len(positions)), pairs)
+            positions = positions[previous]
+            codes = [column[previous] for column in codes] + [np.asarray(key_codes)[entries]]
+            names.append(key_names)
+
+        if not len(positions):
+            return [], np.zeros(0, dtype=np.int64), rows[positions]
+        if not codes:
+            return [()], np.zeros(len(positions), dtype=np.int64), rows[positions]
+        groups, inverse = np.unique(np.stack(codes, axis=1), axis=0, return_inverse=True)
+        labels = [tuple(names[k][code] for k, code in enumerate(group)) for group in groups]
+        return labels, inverse.reshape(-1), rows[positions]
+
+    def _group_keys(self, by, rows):
+        """(row, label1, label2, ...) tuples: the cross product of each key's labels per row"""
+        combined = [(i,) for i in rows]
+        for key in by:
+            labels = {}
+            for i, label in self.keys(key, rows):
+                labels.setdefault(i, []).append(label)
+            combined = [prefix + (label,) for prefix in combined for label in labels.get(prefix[0], [])]
+        return combined
+
+def _expand(np, starts, counts):
+    """Indices starts[i] .. starts[i] + counts[i] - 1 for every i, concatenated"""
+    ends = np.cumsum(counts)
+    return np.repeat(starts - (ends - counts), counts) + np.arange(ends[-1] if len(ends) else 0)
+
+def parse_date(value):
+    """YYYY-MM-DD (UTC) to epoch seconds"""
+    return datetime.strptime(value, '%Y-%m-%d').replace(tzinfo=timezone.utc).timestamp()
+
+def print_table(by, groups, value=None):
+    """Print grouped results, largest first"""
+    header = by + (['mean ' + value, 'n'] if value else ['count'])
+    print('\t'.join(header))
+    if value:
+        ordered = sorted(groups.items(), key=lambda item: -item[1][0])
+        for label, (mean, n) in ordered:
+            print('\t'.join(list(label) + [f"{mean:.1f}", str(n)]))
+    else:
+        for label, count in sorted(groups.items(), key=lambda item: -item[1]):
+            print('\t'.join(list(label) + [str(count)]))
+
+def main(argv=None):
+    # Filters are accepted after the command, as in the examples above
+    filters = argparse.ArgumentParser(add_help=False)
+    filters.add_argument('--since', help="only meetings created on/after YYYY-MM-DD")
+    filters.add_argument('--until', help="only meetings created before YYYY-MM-DD")
+    filters.add_argument('--folder', help="only meetings in this folder")
+    filters.add_argument('--attendee', help="only meetings with this attendee")
+    filters.add_argument('--no-numpy', action='store_true', help="use the pure-Python path")
+
+    parser = argparse.ArgumentParser(description="Query the columnar Granola meeting snapshot")
+    commands = parser.add_subparsers(dest='command')
+
+    count = commands.add_parser('count', parents=[filters], help="count meetings per group")
+    count.add_argument('--by', nargs='+', choices=GROUP_KEYS, default=[])
+
+    mean = commands.add_parser('mean', parents=[filters], help="mean of a value per group")
+    mean.add_argument('value', choices=VALUE_COLUMNS)
+    mean.add_argument('--by', nargs='+', choices=GROUP_KEYS, default=[])
+    args = parser.parse_args(argv)
+
+    if not args.command:
+        parser.print_help()
+        return
+
+    if not (COLUMNS_DIR / "meta.json").exists():
+        print(f"❌ No column snapshot at {COLUMNS_DIR} (run a sync first)")
+        sys.exit(1)
+
+    try:
+        columns = MeetingColumns(np=None if args.no_numpy else get_numpy())
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    rows = columns.rows(
+        since=parse_date(args.since) if args.since else None,
+        until=parse_date(args.until) if args.until else None,
+        folder=args.folder,
+        attendee=args.attendee,
+    )
+
+    if args.command == 'count':
+        print_table(args.by, columns.group_count(args.by, rows))
+    else:
+        print_table(args.by, columns.group_mean(args.value, args.by, rows), value=args.value)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Progress reporting and time formatting for the Granola scripts
+Processed/total, throughput and ETA for long loops, plus the duration and
+timestamp formats used in notes, transcripts and progress lines. Shared by
+import-granola-to-memory.py, extract-granola-full.py and transcript_seek.py;
+install it next to the importer (e.g. ~/granola_progress.py).
+"""
+
+import os
+import sys
+import time
+
+PROGRESS_MODE = os.environ.get('GRANOLA_PROGRESS', 'auto')  # auto, tty, log or off
+PROGRESS_TTY_SECONDS = 0.25  # Redraw interval of the progress line on a terminal
+PROGRESS_LOG_SECONDS = 10.0  # Interval between progress lines in logs
+
+def format_duration(seconds):
+    """Format seconds as e.g. 1h 02m, 12m 05s or 45s"""
+    seconds = int(round(seconds or 0))
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m {secs:02d}s"
+    return f"{secs}s"
+
+def format_timestamp(seconds):
+    """Format seconds as HH:MM:SS"""
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+class Progress:
+    """Processed/total, throughput and ETA for a long loop
+
+    On a terminal one status line is redrawn in place; otherwise (launchd
+    logs, pipes) a key=value line is printed every PROGRESS_LOG_SECONDS
+    and once at the end. The loop itself only increments a counter and
+    compares it with the next checkpoint; the clock is read at most ~10
+    times per interval, however fast the items go.
+
+    bytes_done, if given, is called at report time for the MB/s figure.
+    """
+
+    def __init__(self, label, total, bytes_done=None, mode=None, stream=None):
+        self.label = label
+        self.total = total
+        self.bytes_done = bytes_done
+        self.stream = stream or sys.stdout
+        mode = mode or PROGRESS_MODE
+        if mode == 'auto':
+            mode = 'tty' if self.stream.isatty() else 'log'
+        self.mode = mode
+        self.interval = PROGRESS_TTY_SECONDS if mode == 'tty' else PROGRESS_LOG_SECONDS
+        self.count = 0
+        self.started = time.monotonic()
+        self.last_report = self.started
+        self.last_check = self.started
+        self.last_check_count = 0
+        self.next_check = 1 if mode in ('tty', 'log') else float('inf')
+        self.drawn = False
+        self.closed = False
+
+    def track(self, items):
+        """Yield items, counting each one once it has been processed"""
+        for item in items:
+            yield item
+            self.count += 1
+            if self.count >= self.next_check:
+                self._check()
+        self.close()
+
+    def update(self, n=1):
+        """Count n more processed items"""
+        self.count += n
+        if self.count >= self.next_check:
+            self._check()
+
+    def _check(self):
+        now = time.monotonic()
+        # Next look at the clock after about a tenth of an interval's worth of items
+        rate = (self.count - self.last_check_count) / max(now - self.last_check, 1e-6)
+        self.next_check = self.count + max(1, int(rate * self.interval / 10))
+        self.last_check = now
+        self.last_check_count = self.count
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self._report(now)
+
+    def _figures(self, now):
+        elapsed = max(now - self.started, 1e-6)
+        rate = self.count / elapsed
+        figures = {'done': self.count, 'total': self.total,
+                   'pct': round(100.0 * self.count / self.total, 1) if self.total else 100.0,
+                   'per_s': round(rate, 1), 'elapsed_s': round(elapsed, 1),
+                   'eta_s': round((self.total - self.count) / rate, 1) if rate and self.total else 0.0}
+        if self.bytes_done is not None:
+            figures['mb_per_s'] = round(self.bytes_done() / elapsed / 1e6, 2)
+        return figures
+
+    def _report(self, now, final=False):
+        figures = self._figures(now)
+        if self.mode == 'log':
+            fields = ' '.join(f"{key}={value}" for key, value in figures.items())
+            print(f"progress phase={self.label} {fields}{' final=1' if final else ''}", file=self.stream,
+                  flush=True)
+            return
+        line = (f"⏳ {self.label}: {figures['done']:,}/{figures['total']:,} ({figures['pct']:.0f}%)  "
+                f"{figures['per_s']:,.0f}/s")
+        if 'mb_per_s' in figures:
+            line += f"  {figures['mb_per_s']:.1f} MB/s"
+        line += f"  ETA {format_duration(figures['eta_s'])}"
+        self.stream.write(f"\r\033[K{line}")
+        self.stream.flush()
+        self.drawn = True
+
+    def close(self):
+        """Clear the terminal line, or log the final figures"""
+        if self.closed:
+            return
+        self.closed = True
+        if self.mode == 'tty' and self.drawn:
+            self.stream.write("\r\033[K")
+            self.stream.flush()
+        elif self.mode == 'log':
+            self._report(time.monotonic(), final=True)
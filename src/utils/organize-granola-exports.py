@@ -3,33 +3,214 @@
 Organize Granola exports into your basic-memory structure
 """
 
+import argparse
+import hashlib
+import json
 import os
 import re
+import sys
+import time
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import shutil
 
+if sys.platform.startswith('linux'):
+    import fcntl
+    FICLONE = 0x40049409  # ioctl for copy-on-write clones
+else:
+    FICLONE = None
+
 # Configuration
 EXPORTS_DIR = Path.home() / "granola-exports"
 BASIC_MEMORY_DIR = Path.home() / "basic-memory"
-WORK_MEETINGS_DIR = BASIC_MEMORY_DIR / "areas" / "work" / "meetings"
-PERSONAL_MEETINGS_DIR = BASIC_MEMORY_DIR / "areas" / "personal" / "meetings"
+MANIFEST_FILE = BASIC_MEMORY_DIR / ".granola-organize-manifest.json"
+RULES_FILE = BASIC_MEMORY_DIR / ".granola-organize-rules.json"
+DEFAULT_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+UNSAFE_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Built-in rules, used when no rules file exists. Categories are checked in
+# order; the first category with a matching keyword or pattern wins, and
+# notes matching nothing go to the default category.
+DEFAULT_RULES = {
+    "categories": [
+        {
+            "name": "work",
+            "folder": "areas/work/meetings",
+            "keywords": ["investment", "deal", "pitch", "portfolio", "vc", "fund",
+                         "investopad", "good capital", "huddle", "sync", "standup"],
+            "patterns": []
+        },
+        {
+            "name": "personal",
+            "folder": "areas/personal/meetings",
+            "keywords": [],
+            "patterns": []
+        }
+    ],
+    "default": "personal",
+    "date_patterns": [
+        r"\d{4}-\d{2}-\d{2}",                    # YYYY-MM-DD
+        r"\w{3},\s+\d{1,2}\s+\w{3}\s+\d{2,4}",     # Thu, 24 Jul 25
+        r"\d{1,2}/\d{1,2}/\d{2,4}"                # MM/DD/YYYY or DD/MM/YYYY
+    ],
+    "scan_chars": 1000,
+    "date_scan_chars": 500
+}
+
+def keyword_regex(keywords):
+    """Keywords as one regex, factored into a trie on shared prefixes
+
+    ["invest", "investment", "pitch"] becomes "(?:invest(?:ment)?|pitch)",
+    so the engine tries each distinct first character once per position
+    instead of every keyword.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if '' in node:
+            return f"(?:{body})?" if len(branches) == 1 else body + '?'
+        return body
+
+    return build(trie)
+
+class PriorityMatcher:
+    """Find the lowest-numbered of several regex alternatives in one scan
+
+    The alternatives are named groups of one plain alternation, scanned
+    with finditer. A lower-priority match can overlap (and so hide) a
+    higher-priority one, so once the best index is known the text is
+    rescanned with only the alternatives ranked above it; that happens
+    only when something other than the top alternative matched.
+    """
+
+    def __init__(self, alternatives, prefix, flags=0):
+        self.alternatives = sorted(alternatives)  # [(priority, regex source)]
+        self.prefix = prefix
+        self.flags = flags
+        self.regexes = {}
+
+    def _regex(self, limit):
+        """Compiled alternation of the alternatives ranked above limit"""
+        if limit not in self.regexes:
+            parts = [f"(?P<{self.prefix}{idx}>{source})" for idx, source in self.alternatives if idx < limit]
+            self.regexes[limit] = re.compile('|'.join(parts), self.flags) if parts else None
+        return self.regexes[limit]
+
+    def best(self, text, limit=None):
+        """(priority, match) of the highest-priority alternative in text, or None"""
+        regex = self._regex(float('inf') if limit is None else limit)
+        best = None
+        while regex is not None:
+            # Most texts match nothing: a plain search answers that fastest
+            first = regex.search(text)
+            if first is None:
+                break
+            found = None
+            for match in chain([first], regex.finditer(text, first.end())):
+                idx = int(match.lastgroup[len(self.prefix):])
+                if found is None or idx < found[0]:
+                    found = (idx, match)
+                    if idx == self.alternatives[0][0]:
+                        return found
+            if found is None:
+                break
+            best = found
+            regex = self._regex(found[0])
+        return best
+
+class Classifier:
+    """Rules compiled into one combined regex for category keywords
+
+    Each category becomes a named alternative group, so a note is
+    classified in a single scan instead of one substring search per keyword.
+    Keywords are matched against the lowercased text (case-insensitive
+    regexes are several times slower); user patterns keep IGNORECASE.
+    """
+
+    def __init__(self, rules):
+        self.categories = [c['name'] for c in rules['categories']]
+        self.folders = {c['name']: BASIC_MEMORY_DIR / c['folder'] for c in rules['categories']}
+        self.default = rules.get('default') or self.categories[-1]
+        self.scan_chars = rules.get('scan_chars', 1000)
+        self.date_scan_chars = rules.get('date_scan_chars', 500)
+
+        if self.default not in self.folders:
+            raise ValueError(f"Default category '{self.default}' has no folder")
+
+        keywords = []
+        patterns = []
+        for idx, category in enumerate(rules['categories']):
+            if category.get('keywords'):
+                keywords.append((idx, keyword_regex(k.lower() for k in category['keywords'])))
+            if category.get('patterns'):
+                patterns.append((idx, '|'.join(category['patterns'])))
+        self.keyword_matcher = PriorityMatcher(keywords, 'k') if keywords else None
+        self.pattern_matcher = PriorityMatcher(patterns, 'p', re.IGNORECASE) if patterns else None
+
+        # A handful of date patterns are searched one by one: each keeps
+        # the regex engine's literal/charset fast paths, which an
+        # alternation of them loses
+        self.date_res = [re.compile(pattern) for pattern in rules.get('date_patterns', [])]
+
+    def categorize(self, title, content):
+        """Return the highest-priority category matching the note"""
+        text = f"{title}\n{content[:self.scan_chars]}"
+        best = None
+        if self.keyword_matcher is not None:
+            found = self.keyword_matcher.best(text.lower())
+            best = found[0] if found else None
+        if self.pattern_matcher is not None and best != 0:
+            found = self.pattern_matcher.best(text, best)
+            best = found[0] if found else best
+
+        return self.categories[best] if best is not None else self.default
+
+    def extract_date(self, content):
+        """Return the first match of the earliest-listed date pattern, if any"""
+        text = content[:self.date_scan_chars]
+        for date_re in self.date_res:
+            match = date_re.search(text)
+            if match:
+                return match.group()
+        return None
+
+def load_rules(rules_file=None):
+    """Load classification rules from JSON, falling back to the built-in rules"""
+    path = Path(rules_file) if rules_file else RULES_FILE
+    if path.exists():
+        with open(path, 'r') as f:
+            rules = json.load(f)
+        print(f"📐 Using rules from {path}")
+        return rules
+    if rules_file:
+        raise FileNotFoundError(f"Rules file not found: {path}")
+    return DEFAULT_RULES
+
+_default_classifier = None
+
+def get_default_classifier():
+    """Classifier for the built-in rules, compiled on first use"""
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = Classifier(DEFAULT_RULES)
+    return _default_classifier
 
 def extract_date_from_content(content):
     """Try to extract a date from the note content"""
-    # Look for common date patterns
-    date_patterns = [
-        r'(\d{4}-\d{2}-\d{2})',  # YYYY-MM-DD
-        r'(\w{3},\s+\d{1,2}\s+\w{3}\s+\d{2,4})',  # Thu, 24 Jul 25
-        r'(\d{1,2}/\d{1,2}/\d{2,4})',  # MM/DD/YYYY or DD/MM/YYYY
-    ]
-
-    for pattern in date_patterns:
-        match = re.search(pattern, content[:500])  # Check first 500 chars
-        if match:
-            return match.group(1)
-
-    return None
+    return get_default_classifier().extract_date(content)
 
 def extract_participants(content):
     """Extract participant names from the content"""
@@ -48,32 +229,135 @@ def extract_participants(content):
 
 def categorize_note(title, content):
     """Determine if note is work or personal"""
-    # Check for work-related keywords
-    work_keywords = ['investment', 'deal', 'pitch', 'portfolio', 'vc', 'fund',
-                     'investopad', 'good capital', 'huddle', 'sync', 'standup']
-
-    title_lower = title.lower()
-    content_lower = content[:1000].lower()
-
-    for keyword in work_keywords:
-        if keyword in title_lower or keyword in content_lower:
-            return 'work'
-
-    return 'personal'
-
-def organize_exports():
-    """Main function to organize all exports"""
+    return get_default_classifier().categorize(title, content)
+
+def hash_file(file_path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def load_manifest(target_dirs):
+    """Load the content-hash manifest of already-organized files
+
+    Maps sha256 -> path relative to BASIC_MEMORY_DIR. On first use the
+    manifest is seeded by hashing the notes already in the target folders,
+    so files organized before the manifest existed are not copied again.
+    """
+    if MANIFEST_FILE.exists():
+        try:
+            with open(MANIFEST_FILE, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    manifest = {}
+    for target_dir in target_dirs:
+        if target_dir.exists():
+            for existing in sorted(target_dir.glob("*.md")):
+                manifest.setdefault(hash_file(existing), str(existing.relative_to(BASIC_MEMORY_DIR)))
+    return manifest
+
+def save_manifest(manifest):
+    """Persist the content-hash manifest"""
+    tmp_file = MANIFEST_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_file, MANIFEST_FILE)
+
+def prepare_export(file_path, classifier):
+    """Reader + classifier stage: read, hash and categorize one export
+
+    Runs in the worker pool. Errors are returned rather than raised so the
+    writer can report them in order.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        content = raw.decode('utf-8')
+
+        # Extract title (first line without # if present)
+        lines = content.split('\n')
+        title = lines[0].strip()
+        if title.startswith('# '):
+            title = title[2:].strip()
+
+        # Clean title for filename
+        clean_title = UNSAFE_CHARS_RE.sub('', title)
+        clean_title = clean_title[:100]  # Limit length
+
+        # Extract date
+        date_str = classifier.extract_date(content)
+        if not date_str or not ISO_DATE_RE.match(date_str):
+            # Use file modification time as fallback
+            timestamp = file_path.stat().st_mtime
+            date_str = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d')
+
+        return {
+            'path': file_path,
+            'hash': hashlib.sha256(raw).hexdigest(),
+            'title': clean_title,
+            'date': date_str,
+            'category': classifier.categorize(title, content),
+        }
+    except Exception as e:
+        return {'path': file_path, 'error': e}
+
+def place_file(src, dst, link=True):
+    """Writer stage: hardlink or reflink src to dst, falling back to a copy"""
+    if link:
+        try:
+            os.link(src, dst)
+            return 'linked'
+        except OSError:
+            pass
+
+        # Copy-on-write clone (btrfs/XFS) when hardlinks aren't possible
+        if FICLONE is not None:
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                shutil.copystat(src, dst)
+                return 'cloned'
+            except OSError:
+                if os.path.exists(dst):
+                    os.unlink(dst)
+
+    shutil.copy2(src, dst)
+    return 'copied'
+
+def allocate_filename(taken, date_str, clean_title):
+    """Pick a free filename using the in-memory listing of the target dir"""
+    new_filename = f"{date_str} - {clean_title}.md"
+    counter = 1
+    while new_filename in taken:
+        new_filename = f"{date_str} - {clean_title} ({counter}).md"
+        counter += 1
+    taken.add(new_filename)
+    return new_filename
+
+def organize_exports(workers=DEFAULT_WORKERS, link=True, classifier=None):
+    """Main function to organize all exports
+
+    Exports are read, hashed and categorized in a worker pool while the
+    main thread places the results in order. Notes whose content hash is
+    already in the manifest are skipped instead of being copied again.
+    """
+    classifier = classifier or get_default_classifier()
 
     if not EXPORTS_DIR.exists():
         print(f"❌ Export directory not found: {EXPORTS_DIR}")
         return
 
     # Create output directories if they don't exist
-    WORK_MEETINGS_DIR.mkdir(parents=True, exist_ok=True)
-    PERSONAL_MEETINGS_DIR.mkdir(parents=True, exist_ok=True)
+    target_dirs = classifier.folders
+    for target_dir in target_dirs.values():
+        target_dir.mkdir(parents=True, exist_ok=True)
 
     # Get all markdown files
-    export_files = list(EXPORTS_DIR.glob("*.md"))
+    export_files = sorted(EXPORTS_DIR.glob("*.md"))
 
     if not export_files:
         print(f"❌ No markdown files found in {EXPORTS_DIR}")
@@ -81,70 +365,101 @@ def organize_exports():
 
     print(f"📁 Found {len(export_files)} files to organize")
 
-    work_count = 0
-    personal_count = 0
+    manifest = load_manifest(target_dirs.values())
+
+    # One directory listing per target instead of probing exists() per name
+    taken = {category: set(os.listdir(target_dir)) for category, target_dir in target_dirs.items()}
+
+    counts = {category: 0 for category in target_dirs}
+    duplicate_count = 0
     error_count = 0
 
-    for file_path in export_files:
-        try:
-            # Read content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Extract title (first line without # if present)
-            lines = content.split('\n')
-            title = lines[0].strip()
-            if title.startswith('# '):
-                title = title[2:].strip()
-
-            # Clean title for filename
-            clean_title = re.sub(r'[<>:"/\\|?*]', '', title)
-            clean_title = clean_title[:100]  # Limit length
-
-            # Extract date
-            date_str = extract_date_from_content(content)
-            if not date_str or not re.match(r'\d{4}-\d{2}-\d{2}', date_str):
-                # Use file modification time as fallback
-                timestamp = file_path.stat().st_mtime
-                date_str = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d')
-
-            # Categorize
-            category = categorize_note(title, content)
-
-            # Determine target directory
-            if category == 'work':
-                target_dir = WORK_MEETINGS_DIR
-                work_count += 1
-            else:
-                target_dir = PERSONAL_MEETINGS_DIR
-                personal_count += 1
-
-            # Create new filename
-            new_filename = f"{date_str} - {clean_title}.md"
-            target_path = target_dir / new_filename
-
-            # Handle duplicates
-            counter = 1
-            while target_path.exists():
-                new_filename = f"{date_str} - {clean_title} ({counter}).md"
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for item in pool.map(lambda path: prepare_export(path, classifier), export_files):
+            file_path = item['path']
+            if 'error' in item:
+                print(f"❌ Error processing {file_path.name}: {item['error']}")
+                error_count += 1
+                continue
+
+            existing = manifest.get(item['hash'])
+            if existing and (BASIC_MEMORY_DIR / existing).exists():
+                duplicate_count += 1
+                continue
+
+            try:
+                category = item['category']
+                target_dir = target_dirs[category]
+                new_filename = allocate_filename(taken[category], item['date'], item['title'])
                 target_path = target_dir / new_filename
-                counter += 1
 
-            # Copy file
-            shutil.copy2(file_path, target_path)
-            print(f"✅ {category.upper()}: {new_filename}")
+                method = place_file(file_path, target_path, link)
+                manifest[item['hash']] = str(target_path.relative_to(BASIC_MEMORY_DIR))
+
+                counts[category] += 1
+                print(f"✅ {category.upper()}: {new_filename} ({method})")
 
-        except Exception as e:
-            print(f"❌ Error processing {file_path.name}: {e}")
-            error_count += 1
+            except Exception as e:
+                print(f"❌ Error processing {file_path.name}: {e}")
+                error_count += 1
+
+    save_manifest(manifest)
 
     print(f"\n📊 Summary:")
-    print(f"  Work meetings: {work_count}")
-    print(f"  Personal meetings: {personal_count}")
+    for category, count in counts.items():
+        print(f"  {category.capitalize()} meetings: {count}")
+    print(f"  Already organized: {duplicate_count}")
     print(f"  Errors: {error_count}")
     print(f"\n📁 Organized files are in:")
-    print(f"  Work: {WORK_MEETINGS_DIR}")
-    print(f"  Personal: {PERSONAL_MEETINGS_DIR}")
+    for category, target_dir in target_dirs.items():
+        print(f"  {category.capitalize()}: {target_dir}")
+
+def benchmark_classifier(classifier, min_notes=10000):
+    """Time classification over the export dir, repeated to at least min_notes"""
+    export_files = sorted(EXPORTS_DIR.glob("*.md")) if EXPORTS_DIR.exists() else []
+    if not export_files:
+        print(f"❌ No markdown files found in {EXPORTS_DIR}")
+        return
+
+    notes = []
+    for file_path in export_files:
+        content = file_path.read_text(encoding='utf-8', errors='replace')
+        notes.append((content.split('\n', 1)[0].lstrip('# ').strip(), content))
+
+    rounds = max(1, -(-min_notes // len(notes)))
+    total_bytes = sum(len(content) for _, content in notes) * rounds
+
+    start = time.perf_counter()
+    counts = {}
+    for _ in range(rounds):
+        for title, content in notes:
+            category = classifier.categorize(title, content)
+            classifier.extract_date(content)
+            counts[category] = counts.get(category, 0) + 1
+    elapsed = time.perf_counter() - start
+
+    print(f"⏱️  Classified {len(notes) * rounds} notes ({len(notes)} files x {rounds}) in {elapsed:.3f}s")
+    print(f"   {len(notes) * rounds / elapsed:,.0f} notes/s, {total_bytes / elapsed / 1e6:.1f} MB/s of note text")
+    for category, count in sorted(counts.items()):
+        print(f"   {category}: {count // rounds}")
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Organize Granola exports into basic-memory")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"reader/classifier threads (default: {DEFAULT_WORKERS})")
+    parser.add_argument('--copy', action='store_true',
+                        help="always make full copies instead of hardlinks/reflinks")
+    parser.add_argument('--rules', metavar='FILE',
+                        help=f"classification rules JSON (default: {RULES_FILE} if present)")
+    parser.add_argument('--benchmark', nargs='?', type=int, const=10000, metavar='N',
+                        help="time classification of at least N notes without writing anything")
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    organize_exports()
+    args = parse_args()
+    classifier = Classifier(load_rules(args.rules))
+    if args.benchmark:
+        benchmark_classifier(classifier, args.benchmark)
+    else:
+        organize_exports(workers=args.workers, link=not args.copy, classifier=classifier)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Jump into a synced transcript by time or speaker turn
+Uses the .idx.json sidecar written next to each transcript, so only the
+requested byte range is read, even for multi-hour transcripts
+"""
+
+import argparse
+import json
+import sys
+from bisect import bisect_right
+from pathlib import Path
+
+from granola_progress import format_timestamp
+
+def parse_time(value):
+    """Parse SS, MM:SS or HH:MM:SS into seconds"""
+    seconds = 0.0
+    for part in value.split(':'):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+def load_index(transcript_path):
+    """Load the sidecar index for a transcript"""
+    index_path = transcript_path.with_name(transcript_path.stem + ".idx.json")
+    if not index_path.exists():
+        print(f"❌ No index found at {index_path} (re-run the sync to create it)")
+        sys.exit(1)
+    with open(index_path, 'r') as f:
+        return json.load(f)
+
+def read_segments(transcript_path, segments, first, last):
+    """Read segments first..last (inclusive) with a single seek"""
+    start = segments[first][0]
+    end = segments[last][0] + segments[last][1]
+    with open(transcript_path, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start).decode('utf-8')
+
+def segment_at(segments, seconds):
+    """Index of the segment playing at (or last starting before) a time
+
+    Untimed segments are skipped, so the starts bisected over stay in
+    order; they are still printed when they fall inside a range.
+    """
+    timed = [i for i, seg in enumerate(segments) if seg[2] is not None]
+    starts = [segments[i][2] for i in timed]
+    pos = bisect_right(starts, seconds) - 1
+    return timed[pos] if pos >= 0 else 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Read part of a Granola transcript")
+    parser.add_argument('transcript', type=Path, help="transcript .txt file in _transcripts/")
+    parser.add_argument('--at', help="start time (SS, MM:SS or HH:MM:SS)")
+    parser.add_argument('--until', help="end time (default: one minute after --at)")
+    parser.add_argument('--turn', type=int, help="print speaker turn N (1-based)")
+    parser.add_argument('--speaker', help="list the turns of one speaker")
+    args = parser.parse_args()
+
+    index = load_index(args.transcript)
+    segments = index['segments']
+    turns = index['turns']
+    speakers = index['speakers']
+
+    if not segments:
+        print("Transcript is empty")
+        return
+
+    if args.speaker:
+        if args.speaker not in speakers:
+            print(f"❌ Unknown speaker. Speakers: {', '.join(speakers)}")
+            sys.exit(1)
+        speaker_idx = speakers.index(args.speaker)
+        for n, first in enumerate(turns, 1):
+            seg = segments[first]
+            if seg[4] == speaker_idx:
+                when = format_timestamp(seg[2]) if seg[2] is not None else '--:--:--'
+                print(f"Turn {n:4d}  {when}")
+        return
+
+    if args.turn:
+        if not 1 <= args.turn <= len(turns):
+            print(f"❌ Turn must be between 1 and {len(turns)}")
+            sys.exit(1)
+        first = turns[args.turn - 1]
+        last = turns[args.turn] - 1 if args.turn < len(turns) else len(segments) - 1
+        print(read_segments(args.transcript, segments, first, last))
+        return
+
+    if args.at:
+        start = parse_time(args.at)
+        end = parse_time(args.until) if args.until else start + 60
+        first = segment_at(segments, start)
+        last = max(first, segment_at(segments, end))
+        print(read_segments(args.transcript, segments, first, last))
+        return
+
+    parser.print_help()
+
+if __name__ == "__main__":
+    main()
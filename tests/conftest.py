@@ -0,0 +1,82 @@
+"""Shared fixtures: a small Granola cache synced into a temporary home"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parent.parent
+IMPORTER = REPO / "src" / "import-granola-to-memory.py"
+UTILS = REPO / "src" / "utils"
+
+FOLDERS = {"f-sales": "Sales", "f-ops": "Ops"}
+
+# (doc id, created_at, folder ids, attendee)
+MEETINGS = [
+    ("doc-a", "2025-02-28T23:30:00Z", ["f-sales"], "Priya"),
+    ("doc-b", "2025-03-01T00:15:00Z", ["f-sales", "f-ops"], "Sam"),
+    ("doc-c", "2025-03-01T23:45:00Z", ["f-ops"], "Priya"),
+    ("doc-d", "2025-03-02T09:00:00Z", [], "Sam"),
+    ("doc-e", "2025-04-10T14:00:00Z", ["f-sales"], "Arjun"),
+]
+
+def write_cache(home):
+    """Write a double-encoded cache-v3.json with MEETINGS under home"""
+    documents = {}
+    lists = {folder_id: [] for folder_id in FOLDERS}
+    for doc_id, created_at, folder_ids, attendee in MEETINGS:
+        documents[doc_id] = {
+            "id": doc_id,
+            "title": f"Meeting {doc_id}",
+            "created_at": created_at,
+            "updated_at": created_at,
+            "summary": f"Summary of {doc_id}",
+            "notes_markdown": f"- notes for {doc_id}",
+            "people": {"attendees": [{"name": attendee}]},
+        }
+        for folder_id in folder_ids:
+            lists[folder_id].append(doc_id)
+    state = {
+        "documents": documents,
+        "documentPanels": {},
+        "documentLists": lists,
+        "documentListsMetadata": {folder_id: {"title": name} for folder_id, name in FOLDERS.items()},
+        "transcripts": {},
+    }
+    cache_dir = home / "Library" / "Application Support" / "Granola"
+    cache_dir.mkdir(parents=True)
+    (cache_dir / "cache-v3.json").write_text(json.dumps({"cache": json.dumps({"state": state}), "version": 3}))
+
+def edit_documents(home, edit):
+    """Apply edit(documents) to the cache under home"""
+    path = home / "Library" / "Application Support" / "Granola" / "cache-v3.json"
+    outer = json.loads(path.read_text())
+    inner = json.loads(outer["cache"])
+    edit(inner["state"]["documents"])
+    outer["cache"] = json.dumps(inner)
+    path.write_text(json.dumps(outer))
+
+def run_script(home, script, *args, env=None):
+    """Run a repo script with HOME pointed at home (plus any env overrides)"""
+    overrides = env or {}
+    env = dict(os.environ, HOME=str(home), GRANOLA_PROGRESS="off")
+    for name in ("GRANOLA_CACHE", "GRANOLA_MEMORY_BASE", "GRANOLA_EMBEDDER"):
+        env.pop(name, None)
+    env.update(overrides)
+    return subprocess.run([sys.executable, str(script), *args], env=env, capture_output=True, text=True)
+
+@pytest.fixture
+def granola_home(tmp_path):
+    """A home directory with the test cache, not yet synced"""
+    write_cache(tmp_path)
+    return tmp_path
+
+@pytest.fixture
+def synced_home(granola_home):
+    """A home directory whose cache has been synced once"""
+    result = run_script(granola_home, IMPORTER)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return granola_home
@@ -0,0 +1,28 @@
+"""accounts command: per-account summaries whatever the sink"""
+
+import json
+
+import pytest
+
+from conftest import IMPORTER, run_script
+
+def run_accounts(home, *flags):
+    cache = home / "Library" / "Application Support" / "Granola" / "cache-v3.json"
+    config = home / "accounts.json"
+    config.write_text(json.dumps({"accounts": [
+        {"name": "alex", "cache": str(cache), "output": str(home / "alex" / "Granola")},
+    ]}))
+    result = run_script(home, IMPORTER, "accounts", str(config), *flags)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return result.stdout
+
+@pytest.mark.parametrize("flags, sink", [([], "files"), (["--sink=sqlite"], "sqlite"), (["--sink=jsonl"], "jsonl")])
+def test_summary_per_sink(granola_home, flags, sink):
+    output = run_accounts(granola_home, *flags)
+    assert "alex:" in output and "5 new, 0 updated, 0 unchanged" in output
+    assert f"({sink})" in output
+
+def test_plan_runs_no_sync(granola_home):
+    output = run_accounts(granola_home, "--plan")
+    assert "alex: no sync ran" in output
+    assert not (granola_home / "alex" / "Granola" / ".granola-sync-state.json").exists()
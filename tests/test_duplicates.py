@@ -0,0 +1,45 @@
+"""Near-duplicate detection across syncs"""
+
+import json
+
+from conftest import IMPORTER, edit_documents, run_script
+
+NOTES = " ".join(f"point {i} about the quarterly pricing review and next steps" for i in range(20))
+
+def sync(home):
+    result = run_script(home, IMPORTER)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return result.stdout
+
+def test_duplicates_follow_signature_changes(granola_home):
+    def duplicate(documents):
+        for doc_id in ("doc-a", "doc-b"):
+            documents[doc_id]["notes_markdown"] = NOTES
+            documents[doc_id]["updated_at"] = "2025-05-01T00:00:00Z"
+    edit_documents(granola_home, duplicate)
+    sync(granola_home)
+
+    base = granola_home / "basic-memory" / "Granola"
+    note = base / "_duplicates.md"
+    assert "Meeting doc-a" in note.read_text() and "Meeting doc-b" in note.read_text()
+    assert (base / ".granola-minhash.bin").exists()
+    assert not any("minhash" in meeting
+                   for meeting in json.loads((base / ".granola-sync-state.json").read_text())["meetings"].values())
+
+    # Nothing changed: the note is left alone but still reported
+    mtime = note.stat().st_mtime_ns
+    assert "Possible duplicates: 1" in sync(granola_home)
+    assert note.stat().st_mtime_ns == mtime
+
+    # A renamed meeting is relinked without a new pair search
+    def rename(documents):
+        documents["doc-b"]["title"] = "Pricing review"
+        documents["doc-b"]["updated_at"] = "2025-05-02T00:00:00Z"
+    edit_documents(granola_home, rename)
+    sync(granola_home)
+    assert "Pricing review" in note.read_text()
+
+    # Deleting one of the pair removes the note
+    edit_documents(granola_home, lambda documents: documents.pop("doc-a"))
+    assert "Possible duplicates" not in sync(granola_home)
+    assert not note.exists()
@@ -0,0 +1,41 @@
+"""granola_columns.py against the column snapshot of a synced home"""
+
+import shlex
+import sys
+
+import pytest
+
+from conftest import UTILS, run_script
+
+sys.path.insert(0, str(UTILS))
+import granola_columns  # noqa: E402
+
+COLUMNS = UTILS / "granola_columns.py"
+DOCUMENTED = [line.strip().split(None, 1)[1] for line in granola_columns.__doc__.splitlines()
+              if line.strip().startswith("granola_columns.py ")]
+
+def test_docstring_has_examples():
+    assert len(DOCUMENTED) >= 3
+
+@pytest.mark.parametrize("invocation", DOCUMENTED)
+@pytest.mark.parametrize("numpy_flag", [[], ["--no-numpy"]])
+def test_documented_invocations(synced_home, invocation, numpy_flag):
+    result = run_script(synced_home, COLUMNS, *shlex.split(invocation), *numpy_flag)
+    assert result.returncode == 0, result.stderr
+    header = result.stdout.splitlines()[0].split("\t")
+    assert header[-1] in ("count", "n")
+
+def test_filters_after_command(synced_home):
+    result = run_script(synced_home, COLUMNS, "count", "--by", "folder", "--folder", "Sales",
+                        "--since", "2025-03-01")
+    assert result.returncode == 0, result.stderr
+    rows = dict(line.split("\t") for line in result.stdout.splitlines()[1:])
+    # doc-b (Sales + Ops) and doc-e (Sales) from March on
+    assert rows == {"Sales": "2", "Ops": "1"}
+
+def test_memory_base_override(synced_home, tmp_path_factory):
+    moved = tmp_path_factory.mktemp("elsewhere") / "Granola"
+    (synced_home / "basic-memory" / "Granola").rename(moved)
+    result = run_script(synced_home, COLUMNS, "count", "--by", "folder", env={"GRANOLA_MEMORY_BASE": str(moved)})
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "Sales\t3" in result.stdout
@@ -0,0 +1,47 @@
+"""OutputWriter error handling with the I/O thread"""
+
+import importlib.util
+import threading
+
+import pytest
+
+from conftest import IMPORTER
+
+spec = importlib.util.spec_from_file_location("importer", IMPORTER)
+importer = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(importer)
+
+def failing_chunks():
+    yield "first chunk\n"
+    raise ValueError("render failed")
+
+def call_with_timeout(call):
+    """call() with a timeout, so a deadlock fails instead of hanging"""
+    outcome = {}
+    def run():
+        try:
+            outcome['result'] = call()
+        except BaseException as e:
+            outcome['error'] = e
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(10)
+    assert not thread.is_alive(), f"{call.__name__}() deadlocked"
+    return outcome
+
+def test_render_error_is_raised_at_flush(tmp_path):
+    writer = importer.OutputWriter(threaded=True)
+    writer.write(tmp_path / "a.md", failing_chunks())
+    writer.write(tmp_path / "b.md", "later write")
+    outcome = call_with_timeout(writer.flush)
+    assert isinstance(outcome.get('error'), ValueError)
+    assert not writer.thread.is_alive()
+    assert not (tmp_path / "b.md").exists()
+
+def test_error_is_raised_at_next_write(tmp_path):
+    writer = importer.OutputWriter(threaded=True)
+    writer.write(tmp_path / "a.md", failing_chunks())
+    call_with_timeout(writer.queue.join)
+    with pytest.raises(ValueError):
+        writer.write(tmp_path / "b.md", "later write")
+    assert isinstance(call_with_timeout(writer.flush).get('error'), ValueError)
@@ -0,0 +1,25 @@
+"""--since/--until selection, checked through --plan --json"""
+
+import json
+
+import pytest
+
+from conftest import IMPORTER, run_script
+
+def planned(home, *args):
+    result = run_script(home, IMPORTER, "--plan", "--json", *args)
+    assert result.returncode == 0, result.stderr
+    return sorted(meeting["doc_id"] for meeting in json.loads(result.stdout)["meetings"])
+
+def test_single_day_range(granola_home):
+    # Both meetings created on 2025-03-01 (UTC), including the one at 23:45
+    assert planned(granola_home, "--since", "2025-03-01", "--until", "2025-03-01") == ["doc-b", "doc-c"]
+
+@pytest.mark.parametrize("args, expected", [
+    (["--until", "2025-02-28"], ["doc-a"]),
+    (["--since", "2025-03-02"], ["doc-d", "doc-e"]),
+    (["--since", "2025-02-28", "--until", "2025-03-02"], ["doc-a", "doc-b", "doc-c", "doc-d"]),
+    (["--until", "2025-03-01T12:00:00Z"], ["doc-a", "doc-b"]),
+])
+def test_until_is_inclusive(granola_home, args, expected):
+    assert planned(granola_home, *args) == expected
@@ -0,0 +1,28 @@
+"""Stub notes for meetings in more than one folder"""
+
+import re
+
+from conftest import IMPORTER, edit_documents, run_script
+
+def stubs_created(home):
+    result = run_script(home, IMPORTER)
+    assert result.returncode == 0, result.stdout + result.stderr
+    return int(re.search(r"Stub files created:\s+(\d+)", result.stdout).group(1))
+
+def test_unchanged_stub_is_not_counted(granola_home):
+    # doc-b is in Sales and Ops: one stub
+    assert stubs_created(granola_home) == 1
+
+    # A new summary re-renders the note, but the stub only links to it
+    def resummarize(documents):
+        documents["doc-b"]["summary"] = "A different summary"
+        documents["doc-b"]["updated_at"] = "2025-05-01T00:00:00Z"
+    edit_documents(granola_home, resummarize)
+    assert stubs_created(granola_home) == 0
+
+    # A new title changes the stub
+    def rename(documents):
+        documents["doc-b"]["title"] = "Renamed meeting"
+        documents["doc-b"]["updated_at"] = "2025-05-02T00:00:00Z"
+    edit_documents(granola_home, rename)
+    assert stubs_created(granola_home) == 1